@@ -1,158 +1,171 @@
-"""Core package for Google Ads budget alert system."""
+"""Core package for Google Ads budget alert system.
 
-from .config import (
-    ApplicationConfig,
-    ConfigError,
-    SlackConfig,
-    load_config,
-    load_config_from_env_file,
-    load_env_file,
-    load_google_ads_config,
-    load_schedule_config,
-    load_slack_config,
-)
-from .forecast import (
-    DailyForecastInput,
-    DailyForecastResult,
-    CombinedForecastInput,
-    CombinedForecastResult,
-    MonthlyPaceInput,
-    MonthlyPaceResult,
-    calculate_daily_projection,
-    calculate_monthly_pace,
-    build_combined_forecast,
-)
-from .google_ads_client import (
-    DailyCostSummary,
-    GoogleAdsClientConfig,
-    GoogleAdsCostService,
-    GoogleAdsCredentials,
-    GoogleAdsSearchTransport,
-    MonthToDateCostSummary,
-    QueryRange,
-    build_cost_query,
-    build_daily_query_range,
-    build_month_to_date_query_range,
-)
-from .schedule import (
-    DailyScheduleConfig,
-    DailyScheduleWindow,
-    find_next_run_datetime,
-    generate_daily_schedule,
-    generate_upcoming_run_windows,
-    generate_upcoming_run_times,
-)
-from .notification import SlackNotificationOptions, build_slack_notification_payload
-from .workflow import (
-    ForecastSnapshot,
-    NotificationSender,
-    SlackPayload,
-    build_forecast_snapshot,
-    dispatch_slack_alert,
-)
-from .logging_utils import LoggingConfig, configure_logging, get_logger
-from .transports import DemoTransport
-from .metrics import (
-    AlertRunRecord,
-    AlertRunStatus,
-    MetricsLoadError,
-    SliMeasurement,
-    SliReport,
-    compute_sli_report,
-    load_alert_run_records_from_jsonl,
-    render_sli_report,
-)
-from .cli import (
-    DoctorCheck,
-    DoctorReport,
-    SchedulePreview,
-    SchedulePreviewWindow,
-    build_argument_parser,
-    main as cli_main,
-    render_report,
-    render_schedule_preview,
-    run_doctor,
-    run_schedule_preview,
-    RunResult,
-    RunError,
-    SchedulerProtocol,
-    SchedulerSetupError,
-    render_run_result,
-    run_once,
-    run_scheduler,
-    generate_schedule_preview,
+Public names are resolved lazily (PEP 562) so that ``import google_ads_alert``
+does not import every submodule up front. Set ``GOOGLE_ADS_ALERT_EAGER_IMPORT=1``
+to resolve all exports at import time, which surfaces broken imports early.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+
+# Exported names grouped by the submodule that defines them, in the style of
+# ``lazy_loader.attach``'s ``submod_attrs``.
+_SUBMODULE_ATTRS: dict[str, tuple[str, ...]] = {
+    "config": (
+        "ApplicationConfig",
+        "ConfigError",
+        "SlackConfig",
+        "clear_config_cache",
+        "clear_env_file_cache",
+        "load_config",
+        "load_config_from_env_file",
+        "load_env_file",
+        "load_google_ads_config",
+        "load_schedule_config",
+        "load_slack_config",
+    ),
+    "forecast": (
+        "DailyForecastInput",
+        "DailyForecastResult",
+        "CombinedForecastInput",
+        "CombinedForecastResult",
+        "MonthlyPaceInput",
+        "MonthlyPaceResult",
+        "calculate_daily_projection",
+        "calculate_monthly_pace",
+        "build_combined_forecast",
+    ),
+    "google_ads_client": (
+        "DailyCostSummary",
+        "GoogleAdsClientConfig",
+        "GoogleAdsCostService",
+        "GoogleAdsCredentials",
+        "GoogleAdsSearchTransport",
+        "MonthToDateCostSummary",
+        "QueryRange",
+        "RetryConfig",
+        "build_cost_query",
+        "build_daily_query_range",
+        "build_month_to_date_query_range",
+    ),
+    "schedule": (
+        "DailyScheduleConfig",
+        "DailyScheduleWindow",
+        "find_next_run_datetime",
+        "generate_daily_schedule",
+        "generate_daily_schedule_slots",
+        "generate_upcoming_run_windows",
+        "generate_upcoming_run_times",
+        "iter_upcoming_run_times",
+        "prepare_schedule",
+    ),
+    "notification": (
+        "SlackNotificationOptions",
+        "build_slack_notification_payload",
+    ),
+    "workflow": (
+        "ForecastSnapshot",
+        "NotificationSender",
+        "SlackPayload",
+        "build_forecast_snapshot",
+        "dispatch_slack_alert",
+    ),
+    "logging_utils": (
+        "LoggingConfig",
+        "configure_logging",
+        "get_logger",
+    ),
+    "transports": (
+        "DemoTransport",
+    ),
+    "metrics": (
+        "AlertRunRecord",
+        "AlertRunStatus",
+        "MetricsLoadError",
+        "SliMeasurement",
+        "SliReport",
+        "compute_sli_report",
+        "iter_alert_run_records_from_jsonl",
+        "load_alert_run_records_from_jsonl",
+        "render_sli_report",
+    ),
+    "cli": (
+        "DoctorCheck",
+        "DoctorReport",
+        "SchedulePreview",
+        "SchedulePreviewWindow",
+        "build_argument_parser",
+        "render_report",
+        "render_schedule_preview",
+        "run_doctor",
+        "run_schedule_preview",
+        "RunResult",
+        "RunError",
+        "SchedulerProtocol",
+        "SchedulerSetupError",
+        "render_run_result",
+        "run_once",
+        "run_scheduler",
+        "generate_schedule_preview",
+    ),
+}
+
+# Exported names that differ from the attribute name in their submodule.
+_ALIASES: dict[str, tuple[str, str]] = {
+    "cli_main": ("cli", "main"),
+}
+
+# Maps each exported name to ``(submodule, attribute)``.
+_LAZY: dict[str, tuple[str, str]] = {
+    name: (module_name, name)
+    for module_name, names in _SUBMODULE_ATTRS.items()
+    for name in names
+}
+_LAZY.update(_ALIASES)
+
+__all__ = tuple(_LAZY)
+
+# Submodules reachable as attributes (``google_ads_alert.config``), in the style
+# of ``lazy_loader.attach``'s ``submodules``.
+_SUBMODULES = frozenset(
+    {
+        "cli",
+        "config",
+        "forecast",
+        "google_ads_client",
+        "logging_utils",
+        "metrics",
+        "notification",
+        "schedule",
+        "transports",
+        "workflow",
+    }
 )
 
-__all__ = [
-    "ApplicationConfig",
-    "ConfigError",
-    "SlackConfig",
-    "load_config",
-    "load_config_from_env_file",
-    "load_env_file",
-    "load_google_ads_config",
-    "load_schedule_config",
-    "load_slack_config",
-    "DailyForecastInput",
-    "DailyForecastResult",
-    "CombinedForecastInput",
-    "CombinedForecastResult",
-    "MonthlyPaceInput",
-    "MonthlyPaceResult",
-    "calculate_daily_projection",
-    "calculate_monthly_pace",
-    "build_combined_forecast",
-    "DailyCostSummary",
-    "GoogleAdsClientConfig",
-    "GoogleAdsCostService",
-    "GoogleAdsCredentials",
-    "GoogleAdsSearchTransport",
-    "MonthToDateCostSummary",
-    "QueryRange",
-    "build_cost_query",
-    "build_daily_query_range",
-    "build_month_to_date_query_range",
-    "DailyScheduleConfig",
-    "DailyScheduleWindow",
-    "find_next_run_datetime",
-    "generate_daily_schedule",
-    "generate_upcoming_run_windows",
-    "generate_upcoming_run_times",
-    "SlackNotificationOptions",
-    "build_slack_notification_payload",
-    "ForecastSnapshot",
-    "NotificationSender",
-    "SlackPayload",
-    "build_forecast_snapshot",
-    "dispatch_slack_alert",
-    "LoggingConfig",
-    "configure_logging",
-    "get_logger",
-    "DemoTransport",
-    "AlertRunRecord",
-    "AlertRunStatus",
-    "MetricsLoadError",
-    "SliMeasurement",
-    "SliReport",
-    "compute_sli_report",
-    "load_alert_run_records_from_jsonl",
-    "render_sli_report",
-    "DoctorCheck",
-    "DoctorReport",
-    "SchedulePreview",
-    "SchedulePreviewWindow",
-    "build_argument_parser",
-    "cli_main",
-    "render_report",
-    "render_schedule_preview",
-    "run_doctor",
-    "run_schedule_preview",
-    "RunResult",
-    "RunError",
-    "SchedulerProtocol",
-    "SchedulerSetupError",
-    "render_run_result",
-    "run_once",
-    "run_scheduler",
-    "generate_schedule_preview",
-]
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES:
+        # ``import_module`` also binds the submodule on this package, so later
+        # lookups no longer reach ``__getattr__``.
+        return importlib.import_module(f".{name}", __name__)
+    try:
+        module_name, attribute = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
+
+
+if os.environ.get("GOOGLE_ADS_ALERT_EAGER_IMPORT") == "1":
+    for _name in _LAZY:
+        getattr(sys.modules[__name__], _name)
+    del _name
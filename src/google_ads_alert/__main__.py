@@ -1,9 +1,9 @@
 """Module entry point to expose ``python -m google_ads_alert``."""
 
-from .cli import main
-
 
 def _run() -> int:
+    from .cli import main
+
     return main()
 
 
@@ -3,23 +3,34 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib
 import json
 import logging
 import os
 import sys
-import urllib.error
-import urllib.request
+from collections import ChainMap
+from itertools import chain
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Callable, Iterable, Mapping, Protocol, Sequence
+from types import MappingProxyType
+from typing import Callable, Iterator, Mapping, Protocol, Sequence
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+try:  # Optional: faster JSON encoding straight to bytes.
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - depends on environment
+    orjson = None
+
 from .config import ApplicationConfig, ConfigError, load_config, load_env_file
 from .google_ads_client import GoogleAdsCostService, GoogleAdsSearchTransport
-from .schedule import generate_daily_schedule, generate_upcoming_run_windows
-from .forecast import _coerce_timezone
+from .schedule import (
+    generate_daily_schedule,
+    generate_daily_schedule_slots,
+    generate_upcoming_run_windows,
+)
+from .forecast import _cached_zoneinfo, _coerce_timezone, _get_default_tz
 from .logging_utils import LoggingConfig, configure_logging
 from .workflow import (
     ForecastSnapshot,
@@ -43,6 +54,10 @@ from .metrics import (
 
 _LOG = logging.getLogger("google_ads_alert.cli")
 
+# Reused encoders: compact for the webhook body, indented for CLI output.
+_COMPACT_JSON_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_PRETTY_JSON_ENCODE = json.JSONEncoder(ensure_ascii=False, indent=2).encode
+
 
 @dataclass(frozen=True)
 class DoctorCheck:
@@ -83,11 +98,19 @@ class SchedulePreview:
     windows: tuple[SchedulePreviewWindow, ...]
 
 
+_LOGGING_CONFIGURED = False
+
+
 def _configure_default_logging() -> None:
     """Configure the package logger when no handlers are registered."""
 
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+
     base_logger = logging.getLogger("google_ads_alert")
     if base_logger.handlers:
+        _LOGGING_CONFIGURED = True
         return
 
     env = os.environ
@@ -97,8 +120,8 @@ def _configure_default_logging() -> None:
     timezone: ZoneInfo | None = None
     if tz_name:
         try:
-            timezone = ZoneInfo(tz_name)
-        except Exception:  # pragma: no cover - depends on system tz database
+            timezone = _cached_zoneinfo(tz_name)
+        except (ZoneInfoNotFoundError, ValueError):
             timezone = None
 
     fmt = env.get("GOOGLE_ADS_LOG_FORMAT")
@@ -112,6 +135,26 @@ def _configure_default_logging() -> None:
             datefmt=datefmt or None,
         )
     )
+    _LOGGING_CONFIGURED = True
+
+
+def _load_env_file_config(
+    path: Path, base_values: Mapping[str, str], source_label: str
+) -> tuple[ApplicationConfig, Mapping[str, str]]:
+    _LOG.debug("Loading configuration from %s", source_label)
+    # ``load_env_file`` and ``load_config`` are memoized, so reloading is cheap.
+    # Snapshot the base environment so later mutations of ``base_env`` or
+    # ``os.environ`` do not leak into the returned values; file values are
+    # layered on top with a ChainMap instead of a second merged copy.
+    file_values = load_env_file(path)
+    merged = ChainMap(file_values, dict(base_values))
+    try:
+        config = load_config(merged)
+    except ConfigError as exc:
+        _LOG.exception("Configuration loading failed: %s", exc)
+        raise ConfigError(f"Failed to load configuration from {path}: {exc}") from exc
+    return config, MappingProxyType(merged)
+
 
 def _load_application_config(
     env_path: str | Path | None,
@@ -119,28 +162,24 @@ def _load_application_config(
     base_env: Mapping[str, str] | None,
 ) -> tuple[ApplicationConfig, list[DoctorCheck], Mapping[str, str]]:
     checks: list[DoctorCheck] = []
-    base_values = dict(base_env or os.environ)
-    if env_path is None:
-        source_label = "environment variables"
+    base_values: Mapping[str, str] = base_env or os.environ
+    path = env_path if env_path is None or isinstance(env_path, Path) else Path(env_path)
+    source_label = "environment variables" if path is None else str(path)
+
+    if path is None:
+        # Without an env file there is nothing to merge: ``load_config`` only
+        # reads a handful of keys, so hand it the mapping directly instead of
+        # copying the whole process environment per call. Factories get a
+        # read-only view so they cannot mutate ``os.environ`` or ``base_env``.
         _LOG.debug("Loading configuration from %s", source_label)
         try:
             config = load_config(base_values)
         except ConfigError as exc:
             _LOG.exception("Configuration loading failed: %s", exc)
             raise ConfigError(f"Failed to load configuration: {exc}") from exc
-        env_values: Mapping[str, str] = base_values
+        env_values: Mapping[str, str] = MappingProxyType(base_values)
     else:
-        path = Path(env_path)
-        source_label = str(path)
-        _LOG.debug("Loading configuration from %s", source_label)
-        file_values = load_env_file(path)
-        merged = {**base_values, **file_values}
-        try:
-            config = load_config(merged)
-        except ConfigError as exc:
-            _LOG.exception("Configuration loading failed: %s", exc)
-            raise ConfigError(f"Failed to load configuration from {path}: {exc}") from exc
-        env_values = merged
+        config, env_values = _load_env_file_config(path, base_values, source_label)
 
     checks.append(
         DoctorCheck(
@@ -153,6 +192,9 @@ def _load_application_config(
     return config, checks, env_values
 
 
+_SLACK_WEBHOOK_PREFIX = "https://hooks.slack.com/"
+
+
 def _check_slack_webhook(config: ApplicationConfig) -> DoctorCheck:
     url = config.slack.webhook_url.strip()
     if not url:
@@ -161,6 +203,12 @@ def _check_slack_webhook(config: ApplicationConfig) -> DoctorCheck:
             passed=False,
             details="Slack webhook URL is empty.",
         )
+    if url.startswith(_SLACK_WEBHOOK_PREFIX):
+        return DoctorCheck(
+            name="slack.webhook",
+            passed=True,
+            details="Webhook appears valid.",
+        )
     if not url.startswith("https://"):
         return DoctorCheck(
             name="slack.webhook",
@@ -168,48 +216,34 @@ def _check_slack_webhook(config: ApplicationConfig) -> DoctorCheck:
             details="Slack webhook URL must start with 'https://'.",
         )
 
-    endpoint_note = ""
-    if "hooks.slack.com" not in url:
-        endpoint_note = " (non-standard endpoint detected)"
-
     return DoctorCheck(
         name="slack.webhook",
         passed=True,
-        details=f"Webhook appears valid{endpoint_note}.",
+        details="Webhook appears valid (non-standard endpoint detected).",
     )
 
 
-def _check_budgets(config: ApplicationConfig) -> Iterable[DoctorCheck]:
-    checks: list[DoctorCheck] = []
+def _check_budget(name: str, label: str, title: str, value: float | None) -> DoctorCheck:
+    if value is None:
+        return DoctorCheck(name=name, passed=True, details=f"No {label} budget configured.")
+    if value < 0:
+        return DoctorCheck(
+            name=name,
+            passed=False,
+            details=f"{title} budget must not be negative (current: {value}).",
+        )
+    return DoctorCheck(
+        name=name,
+        passed=True,
+        details=f"{title} budget configured: {value:,.2f}.",
+    )
 
-    for label, value in (("daily", config.daily_budget), ("monthly", config.monthly_budget)):
-        if value is None:
-            checks.append(
-                DoctorCheck(
-                    name=f"budget.{label}",
-                    passed=True,
-                    details=f"No {label} budget configured.",
-                )
-            )
-            continue
 
-        if value < 0:
-            checks.append(
-                DoctorCheck(
-                    name=f"budget.{label}",
-                    passed=False,
-                    details=f"{label.title()} budget must not be negative (current: {value}).",
-                )
-            )
-        else:
-            checks.append(
-                DoctorCheck(
-                    name=f"budget.{label}",
-                    passed=True,
-                    details=f"{label.title()} budget configured: {value:,.2f}.",
-                )
-            )
-    return checks
+def _check_budgets(config: ApplicationConfig) -> tuple[DoctorCheck, ...]:
+    return (
+        _check_budget("budget.daily", "daily", "Daily", config.daily_budget),
+        _check_budget("budget.monthly", "monthly", "Monthly", config.monthly_budget),
+    )
 
 
 def _check_schedule(config: ApplicationConfig) -> DoctorCheck:
@@ -251,57 +285,66 @@ def run_doctor(
     _configure_default_logging()
     _LOG.info("Running doctor checks", extra={"env_path": str(env_path) if env_path else None})
     try:
-        config, checks, _ = _load_application_config(env_path, base_env=base_env)
+        config, load_checks, _ = _load_application_config(env_path, base_env=base_env)
     except ConfigError as exc:
         _LOG.error("Doctor failed: %s", exc)
         return DoctorReport(checks=(), errors=(str(exc),))
 
-    checks.append(_check_slack_webhook(config))
-    checks.extend(_check_budgets(config))
-    checks.append(_check_schedule(config))
+    checks = (
+        *load_checks,
+        _check_slack_webhook(config),
+        *_check_budgets(config),
+        _check_schedule(config),
+    )
 
     _LOG.info("Doctor completed with %d check(s)", len(checks))
-    return DoctorReport(checks=tuple(checks))
+    return DoctorReport(checks=checks)
 
 
-def render_report(report: DoctorReport) -> str:
-    """Render a human-friendly summary for :class:`DoctorReport`."""
+_CHECK_SYMBOLS = ("✖", "✔")
 
+
+def _iter_report_lines(report: DoctorReport) -> Iterator[str]:
     status = "PASS" if report.passed else "FAIL"
-    lines = [f"Doctor summary: {status}"]
+    yield f"Doctor summary: {status}"
 
     for check in report.checks:
-        symbol = "✔" if check.passed else "✖"
-        lines.append(f"{symbol} {check.name}: {check.details}")
+        yield f"{_CHECK_SYMBOLS[check.passed]} {check.name}: {check.details}"
 
     for error in report.errors:
-        lines.append(f"✖ error: {error}")
+        yield f"✖ error: {error}"
 
-    return "\n".join(lines)
+
+def render_report(report: DoctorReport) -> str:
+    """Render a human-friendly summary for :class:`DoctorReport`."""
+
+    return "\n".join(_iter_report_lines(report))
 
 
 def _resolve_preview_timezone(
     config: ApplicationConfig, windows: Sequence[SchedulePreviewWindow]
 ) -> ZoneInfo | None:
-    for window in windows:
-        for run in window.run_times:
-            tzinfo = run.tzinfo
-            if tzinfo is None:
-                continue
-            if isinstance(tzinfo, ZoneInfo):
-                return tzinfo
-            tz_name = tzinfo.tzname(run)
-            if tz_name:
-                try:
-                    return ZoneInfo(tz_name)
-                except Exception:  # pragma: no cover - ZoneInfo errors vary
-                    continue
+    # The schedule generator emits runs in the configured zone, so scanning
+    # the windows is only needed when the config does not carry a ZoneInfo.
     if isinstance(config.schedule.timezone, ZoneInfo):
         return config.schedule.timezone
-    try:
-        return ZoneInfo("Asia/Tokyo")
-    except Exception:  # pragma: no cover - ZoneInfo errors vary
-        return None
+    # Runs usually share one tzinfo instance; skip those already known not to
+    # resolve instead of repeating the lookup for every run.
+    unresolved: set[int] = set()
+    for run in chain.from_iterable(window.run_times for window in windows):
+        tzinfo = run.tzinfo
+        if tzinfo is None or id(tzinfo) in unresolved:
+            continue
+        if isinstance(tzinfo, ZoneInfo):
+            return tzinfo
+        tz_name = tzinfo.tzname(run)
+        if tz_name:
+            try:
+                return _cached_zoneinfo(tz_name)
+            except (ZoneInfoNotFoundError, ValueError):
+                pass
+        unresolved.add(id(tzinfo))
+    return _get_default_tz()
 
 
 def generate_schedule_preview(
@@ -320,8 +363,9 @@ def generate_schedule_preview(
         "Generating schedule preview",
         extra={"days": days, "reference_time": now.isoformat()},
     )
+    # ``DailyScheduleWindow.run_times`` is already an immutable tuple.
     windows = tuple(
-        SchedulePreviewWindow(window.date, tuple(window.run_times))
+        SchedulePreviewWindow(window.date, window.run_times)
         for window in generate_upcoming_run_windows(now, days, config.schedule)
     )
 
@@ -355,27 +399,27 @@ def run_schedule_preview(
     return preview
 
 
-def render_schedule_preview(preview: SchedulePreview) -> str:
-    """Return a readable summary of :class:`SchedulePreview`."""
-
-    lines = [
-        "Schedule preview:",
-        f"Generated at: {preview.generated_at.isoformat()}",
-    ]
+def _iter_preview_lines(preview: SchedulePreview) -> Iterator[str]:
+    yield "Schedule preview:"
+    yield f"Generated at: {preview.generated_at.isoformat()}"
 
     if not preview.windows:
-        lines.append("No schedule entries available.")
-        return "\n".join(lines)
+        yield "No schedule entries available."
+        return
 
     for window in preview.windows:
-        lines.append(f"{window.date.isoformat()}")
+        yield window.date.isoformat()
         if window.run_times:
-            for run in window.run_times:
-                lines.append(f"  - {run.isoformat()}")
+            # One joined chunk per day instead of a formatted line per run.
+            yield "  - " + "\n  - ".join([run.isoformat() for run in window.run_times])
         else:
-            lines.append("  (no remaining runs)")
+            yield "  (no remaining runs)"
 
-    return "\n".join(lines)
+
+def render_schedule_preview(preview: SchedulePreview) -> str:
+    """Return a readable summary of :class:`SchedulePreview`."""
+
+    return "\n".join(_iter_preview_lines(preview))
 
 
 def _parse_metrics_datetime(value: str | None, *, argument: str) -> datetime | None:
@@ -445,7 +489,10 @@ class SchedulerProtocol(Protocol):
 SchedulerFactory = Callable[[ZoneInfo], SchedulerProtocol]
 
 
+@functools.lru_cache(maxsize=64)
 def _import_factory(spec: str, *, default_attr: str) -> Callable:
+    # Successful resolutions are cached; failures raise and are retried on the
+    # next call. ``_import_factory.cache_clear()`` resets the cache.
     module_name, _, attr = spec.partition(":")
     if not module_name:
         raise ConfigError(f"Invalid factory specification: '{spec}'")
@@ -482,27 +529,49 @@ def _resolve_transport_factory(
     return factory(config, env_values)
 
 
+_SLACK_REQUEST_HEADERS = {"Content-Type": "application/json"}
+_SLACK_TIMEOUT_SECONDS = 10
+
+
+def _encode_slack_payload(payload: SlackPayload) -> bytes:
+    """Encode ``payload`` as compact UTF-8 JSON for the webhook body.
+
+    The orjson and stdlib paths emit the same bytes for the strings, booleans
+    and small ints that Slack payloads are built from, but they are not
+    interchangeable in general: float spellings can differ (``1e16`` vs
+    ``1e+16``), non-finite floats become ``null`` rather than ``NaN``, and
+    orjson rejects ints wider than 64 bits.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return _COMPACT_JSON_ENCODE(payload).encode("utf-8")
+
+
 def _build_slack_sender(webhook_url: str) -> NotificationSender:
     def _sender(payload: SlackPayload) -> None:
-        data = json.dumps(payload).encode("utf-8")
+        # ``urllib.request`` pulls in ``http.client``, ``email`` and ``ssl``;
+        # only commands that actually post to Slack pay for that import.
+        import urllib.error
+        import urllib.request
+
         request = urllib.request.Request(
             webhook_url,
-            data=data,
-            headers={"Content-Type": "application/json"},
+            data=_encode_slack_payload(payload),
+            headers=_SLACK_REQUEST_HEADERS,
             method="POST",
         )
         try:
-            with urllib.request.urlopen(request, timeout=10) as response:
-                if 200 <= getattr(response, "status", 200) < 300:
-                    return
-                raise RunError(
-                    f"Slack webhook responded with status {getattr(response, 'status', 'unknown')}"
-                )
-        except urllib.error.HTTPError as exc:  # pragma: no cover - network errors vary
+            with urllib.request.urlopen(request, timeout=_SLACK_TIMEOUT_SECONDS) as response:
+                status = getattr(response, "status", 200)
+        except urllib.error.HTTPError as exc:
             raise RunError(f"Slack webhook error: {exc.code} {exc.reason}") from exc
         except urllib.error.URLError as exc:  # pragma: no cover - network errors vary
             raise RunError(f"Failed to reach Slack webhook: {exc.reason}") from exc
 
+        if not 200 <= status < 300:
+            raise RunError(f"Slack webhook responded with status {status}")
+
     return _sender
 
 
@@ -615,17 +684,20 @@ def _build_scheduler_job(
     transport_path: str | None,
     sender_path: str | None,
 ) -> Callable[[], RunResult]:
+    invoke = functools.partial(
+        run_once,
+        env_path,
+        base_env=base_env,
+        dry_run=dry_run,
+        transport_factory=transport_factory,
+        sender_factory=sender_factory,
+        transport_path=transport_path,
+        sender_path=sender_path,
+    )
+
     def _job() -> RunResult:
         _LOG.info("Executing scheduled alert job")
-        result = run_once(
-            env_path,
-            base_env=base_env,
-            dry_run=dry_run,
-            transport_factory=transport_factory,
-            sender_factory=sender_factory,
-            transport_path=transport_path,
-            sender_path=sender_path,
-        )
+        result = invoke()
 
         if isinstance(result, RunResult):
             _LOG.info(
@@ -655,7 +727,7 @@ def _prepare_scheduler(
 
     try:
         from apscheduler.schedulers.blocking import BlockingScheduler
-    except ModuleNotFoundError as exc:  # pragma: no cover - depends on environment
+    except ModuleNotFoundError as exc:
         raise SchedulerSetupError(
             "APScheduler is required to run the recurring scheduler. "
             "Install 'APScheduler' or provide a custom scheduler_factory."
@@ -672,44 +744,26 @@ def _register_daily_jobs(
     *,
     job_id_prefix: str = "daily-alert",
 ) -> None:
-    schedule = generate_daily_schedule(date.today(), config.schedule)
-    seen_slots: set[tuple[int, int, int]] = set()
-    job_index = 0
-
-    for run_time in schedule:
-        localized = run_time
-        if localized.tzinfo is None:
-            localized = localized.replace(tzinfo=tz)
-        else:
-            localized = localized.astimezone(tz)
-
-        slot = (localized.hour, localized.minute, localized.second)
-        if slot in seen_slots:
-            continue
-        seen_slots.add(slot)
+    slots = generate_daily_schedule_slots(date.today(), config.schedule, tz)
+    tz_label = getattr(tz, "key", str(tz))
 
+    for job_index, (hour, minute, second) in enumerate(slots):
         scheduler.add_job(
             job,
             trigger="cron",
             id=f"{job_id_prefix}-{job_index}",
             replace_existing=True,
-            hour=localized.hour,
-            minute=localized.minute,
-            second=localized.second,
+            hour=hour,
+            minute=minute,
+            second=second,
             timezone=tz,
         )
-        _LOG.info(
+        _LOG.debug(
             "Registered daily alert job",
-            extra={
-                "hour": localized.hour,
-                "minute": localized.minute,
-                "second": localized.second,
-                "tz": getattr(tz, "key", str(tz)),
-            },
+            extra={"hour": hour, "minute": minute, "second": second, "tz": tz_label},
         )
-        job_index += 1
 
-    _LOG.info("Total scheduled jobs: %d", job_index)
+    _LOG.info("Registered %d daily alert job(s) in %s", len(slots), tz_label)
 
 
 def run_scheduler(
@@ -725,7 +779,9 @@ def run_scheduler(
 ) -> SchedulerProtocol:
     _configure_default_logging()
     _LOG.info("Configuring scheduler", extra={"dry_run": dry_run})
-    config, _, env_values = _load_application_config(env_path, base_env=base_env)
+    # Resolve once so every scheduled run reuses the same Path instance.
+    resolved_env_path = Path(env_path).resolve() if env_path is not None else None
+    config, _, env_values = _load_application_config(resolved_env_path, base_env=base_env)
     tz = _coerce_timezone(config.schedule.timezone)
 
     scheduler = _prepare_scheduler(tz, scheduler_factory)
@@ -735,7 +791,7 @@ def run_scheduler(
         _LOG.debug("Existing scheduler jobs cleared")
 
     job = _build_scheduler_job(
-        env_path,
+        resolved_env_path,
         base_env=dict(env_values),
         dry_run=dry_run,
         transport_factory=transport_factory,
@@ -766,14 +822,26 @@ def render_run_result(result: RunResult) -> str:
         f"Daily spend: {daily_cost:,.2f}",
         f"Month-to-date spend: {month_cost:,.2f}",
         f"Delivery: {delivery_status}",
-        "Payload:",
-        json.dumps(result.payload, ensure_ascii=False, indent=2),
     ]
+    if result.dry_run:
+        lines.append("Payload:")
+        lines.append(_PRETTY_JSON_ENCODE(result.payload))
+    else:
+        # The payload has already been sent; a size summary is enough and
+        # avoids a second, indented serialization.
+        block_count = len(result.payload.get("blocks", ()))
+        payload_size = len(_encode_slack_payload(result.payload))
+        lines.append(f"Payload: {block_count} block(s), {payload_size} bytes")
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=None)
 def build_argument_parser() -> argparse.ArgumentParser:
-    """Return the argument parser for the command line interface."""
+    """Return the argument parser for the command line interface.
+
+    The parser is built on first use and shared afterwards; treat it as
+    read-only.
+    """
 
     parser = argparse.ArgumentParser(prog="google_ads_alert", description="Google Ads alert utilities")
     subparsers = parser.add_subparsers(dest="command")
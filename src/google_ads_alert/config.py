@@ -2,6 +2,8 @@ from __future__ import annotations
 
 """Environment driven configuration loading helpers."""
 
+import functools
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Mapping
@@ -10,7 +12,7 @@ import os
 
 from zoneinfo import ZoneInfo
 
-from .forecast import _coerce_timezone
+from .forecast import _cached_zoneinfo, _coerce_timezone
 from .google_ads_client import GoogleAdsClientConfig, GoogleAdsCredentials
 from .notification import SlackNotificationOptions
 from .schedule import DailyScheduleConfig
@@ -20,7 +22,7 @@ class ConfigError(ValueError):
     """Raised when configuration values are missing or invalid."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlackConfig:
     """Slack specific configuration including the webhook and payload options."""
 
@@ -28,7 +30,7 @@ class SlackConfig:
     options: SlackNotificationOptions
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ApplicationConfig:
     """Aggregate configuration required to run the alert workflow."""
 
@@ -39,10 +41,16 @@ class ApplicationConfig:
     monthly_budget: float | None = None
 
 
-def _read_env(env: Mapping[str, str] | None = None) -> Mapping[str, str]:
-    if env is None:
-        return os.environ
-    return env
+# Dataclass defaults used when optional settings are absent, resolved once.
+_SLACK_OPTION_DEFAULTS = {
+    name: field.default
+    for name, field in SlackNotificationOptions.__dataclass_fields__.items()
+}
+_GOOGLE_ADS_ENDPOINT_DEFAULT = GoogleAdsClientConfig.__dataclass_fields__["endpoint"].default
+_SCHEDULE_DEFAULTS = {
+    name: field.default
+    for name, field in DailyScheduleConfig.__dataclass_fields__.items()
+}
 
 
 def _get_required(env: Mapping[str, str], key: str) -> str:
@@ -64,13 +72,14 @@ def _parse_timezone(value: str | None) -> ZoneInfo | None:
     if not value:
         return None
     try:
-        return ZoneInfo(value)
+        return _cached_zoneinfo(value)
     except Exception as exc:  # pragma: no cover - ZoneInfo raises various errors
         raise ConfigError(f"Invalid timezone identifier: {value}") from exc
 
 
 def _parse_int(value: str | None, *, default: int) -> int:
-    if value is None or value.strip() == "":
+    # ``int``/``float`` accept surrounding whitespace, so no ``strip`` copy.
+    if not value or value.isspace():
         return default
     try:
         return int(value)
@@ -79,7 +88,7 @@ def _parse_int(value: str | None, *, default: int) -> int:
 
 
 def _parse_float(value: str | None) -> float | None:
-    if value is None or value.strip() == "":
+    if not value or value.isspace():
         return None
     try:
         return float(value)
@@ -87,21 +96,36 @@ def _parse_float(value: str | None) -> float | None:
         raise ConfigError(f"Expected float for value '{value}'") from exc
 
 
+_BOOL_TOKENS: dict[str, bool] = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "y": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "n": False,
+    "off": False,
+}
+
+
 def _parse_bool(value: str | None, *, default: bool) -> bool:
-    if value is None or value.strip() == "":
+    if value is None:
         return default
     normalized = value.strip().lower()
-    if normalized in {"true", "1", "yes", "y", "on"}:
-        return True
-    if normalized in {"false", "0", "no", "n", "off"}:
-        return False
+    if not normalized:
+        return default
+    result = _BOOL_TOKENS.get(normalized)
+    if result is not None:
+        return result
     raise ConfigError(f"Expected boolean value for '{value}'")
 
 
 def load_google_ads_config(env: Mapping[str, str] | None = None) -> GoogleAdsClientConfig:
     """Build :class:`GoogleAdsClientConfig` from environment variables."""
 
-    values = _read_env(env)
+    values = env if env is not None else os.environ
     credentials = GoogleAdsCredentials(
         developer_token=_get_required(values, "GOOGLE_ADS_DEVELOPER_TOKEN"),
         client_id=_get_required(values, "GOOGLE_ADS_CLIENT_ID"),
@@ -117,34 +141,34 @@ def load_google_ads_config(env: Mapping[str, str] | None = None) -> GoogleAdsCli
         customer_id=_get_required(values, "GOOGLE_ADS_CUSTOMER_ID"),
         credentials=credentials,
         timezone=timezone,
-        endpoint=endpoint or GoogleAdsClientConfig.__dataclass_fields__["endpoint"].default,
+        endpoint=endpoint or _GOOGLE_ADS_ENDPOINT_DEFAULT,
     )
 
 
 def load_slack_config(env: Mapping[str, str] | None = None) -> SlackConfig:
     """Build :class:`SlackConfig` using environment variables."""
 
-    values = _read_env(env)
+    values = env if env is not None else os.environ
     webhook_url = _get_required(values, "SLACK_WEBHOOK_URL")
     timezone = _parse_timezone(_get_optional(values, "SLACK_TIMEZONE"))
     options = SlackNotificationOptions(
         account_name=_get_optional(values, "SLACK_ACCOUNT_NAME"),
         currency_symbol=(
             _get_optional(values, "SLACK_CURRENCY_SYMBOL")
-            or SlackNotificationOptions.__dataclass_fields__["currency_symbol"].default
+            or _SLACK_OPTION_DEFAULTS["currency_symbol"]
         ),
         timezone=_coerce_timezone(timezone),
         include_monthly_section=_parse_bool(
             values.get("SLACK_INCLUDE_MONTHLY_SECTION"),
-            default=SlackNotificationOptions.__dataclass_fields__["include_monthly_section"].default,
+            default=_SLACK_OPTION_DEFAULTS["include_monthly_section"],
         ),
         include_spend_rate=_parse_bool(
             values.get("SLACK_INCLUDE_SPEND_RATE"),
-            default=SlackNotificationOptions.__dataclass_fields__["include_spend_rate"].default,
+            default=_SLACK_OPTION_DEFAULTS["include_spend_rate"],
         ),
         include_average_daily_spend=_parse_bool(
             values.get("SLACK_INCLUDE_AVERAGE_DAILY_SPEND"),
-            default=SlackNotificationOptions.__dataclass_fields__["include_average_daily_spend"].default,
+            default=_SLACK_OPTION_DEFAULTS["include_average_daily_spend"],
         ),
     )
 
@@ -154,23 +178,56 @@ def load_slack_config(env: Mapping[str, str] | None = None) -> SlackConfig:
 def load_schedule_config(env: Mapping[str, str] | None = None) -> DailyScheduleConfig:
     """Build :class:`DailyScheduleConfig` from environment variables."""
 
-    values = _read_env(env)
-    defaults = DailyScheduleConfig()
+    values = env if env is not None else os.environ
     timezone = _parse_timezone(_get_optional(values, "ALERT_TIMEZONE"))
     return DailyScheduleConfig(
         timezone=_coerce_timezone(timezone),
-        start_hour=_parse_int(values.get("ALERT_START_HOUR"), default=defaults.start_hour),
-        start_minute=_parse_int(values.get("ALERT_START_MINUTE"), default=defaults.start_minute),
-        end_hour=_parse_int(values.get("ALERT_END_HOUR"), default=defaults.end_hour),
-        end_minute=_parse_int(values.get("ALERT_END_MINUTE"), default=defaults.end_minute),
-        run_count=_parse_int(values.get("ALERT_RUN_COUNT"), default=defaults.run_count),
+        start_hour=_parse_int(
+            values.get("ALERT_START_HOUR"), default=_SCHEDULE_DEFAULTS["start_hour"]
+        ),
+        start_minute=_parse_int(
+            values.get("ALERT_START_MINUTE"), default=_SCHEDULE_DEFAULTS["start_minute"]
+        ),
+        end_hour=_parse_int(values.get("ALERT_END_HOUR"), default=_SCHEDULE_DEFAULTS["end_hour"]),
+        end_minute=_parse_int(
+            values.get("ALERT_END_MINUTE"), default=_SCHEDULE_DEFAULTS["end_minute"]
+        ),
+        run_count=_parse_int(values.get("ALERT_RUN_COUNT"), default=_SCHEDULE_DEFAULTS["run_count"]),
     )
 
 
-def load_config(env: Mapping[str, str] | None = None) -> ApplicationConfig:
-    """Load the aggregated application configuration from ``env``."""
-
-    values = _read_env(env)
+# Every environment variable read by the ``load_*_config`` helpers. ``load_config``
+# memoizes on these values only, so keep this in sync when adding settings.
+_CONFIG_KEYS = (
+    "GOOGLE_ADS_DEVELOPER_TOKEN",
+    "GOOGLE_ADS_CLIENT_ID",
+    "GOOGLE_ADS_CLIENT_SECRET",
+    "GOOGLE_ADS_REFRESH_TOKEN",
+    "GOOGLE_ADS_LOGIN_CUSTOMER_ID",
+    "GOOGLE_ADS_TIMEZONE",
+    "GOOGLE_ADS_ENDPOINT",
+    "GOOGLE_ADS_CUSTOMER_ID",
+    "SLACK_WEBHOOK_URL",
+    "SLACK_TIMEZONE",
+    "SLACK_ACCOUNT_NAME",
+    "SLACK_CURRENCY_SYMBOL",
+    "SLACK_INCLUDE_MONTHLY_SECTION",
+    "SLACK_INCLUDE_SPEND_RATE",
+    "SLACK_INCLUDE_AVERAGE_DAILY_SPEND",
+    "ALERT_TIMEZONE",
+    "ALERT_START_HOUR",
+    "ALERT_START_MINUTE",
+    "ALERT_END_HOUR",
+    "ALERT_END_MINUTE",
+    "ALERT_RUN_COUNT",
+    "DAILY_BUDGET",
+    "MONTHLY_BUDGET",
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_config(key_values: tuple[str | None, ...]) -> ApplicationConfig:
+    values = {key: value for key, value in zip(_CONFIG_KEYS, key_values) if value is not None}
     google_ads = load_google_ads_config(values)
     slack = load_slack_config(values)
     schedule = load_schedule_config(values)
@@ -186,50 +243,112 @@ def load_config(env: Mapping[str, str] | None = None) -> ApplicationConfig:
     )
 
 
+def load_config(env: Mapping[str, str] | None = None) -> ApplicationConfig:
+    """Load the aggregated application configuration from ``env``.
+
+    Results are memoized on the values of the recognised settings, so repeated
+    loads from an unchanged environment skip parsing. Call
+    :func:`clear_config_cache` to drop cached entries explicitly.
+    """
+
+    values = env if env is not None else os.environ
+    get = values.get
+    return _build_config(tuple([get(key) for key in _CONFIG_KEYS]))
+
+
+def clear_config_cache() -> None:
+    """Drop the configurations memoized by :func:`load_config`."""
+
+    _build_config.cache_clear()
+
+
+# Matches one line of a ``.env`` file: a comment, a ``KEY=value`` assignment
+# (optionally prefixed with ``export``) or anything else, which is reported as
+# invalid when non-blank. An assigned value is either fully quoted, an
+# unterminated quote, or bare text whose `` #`` suffix is a comment.
+# ``[^\S\n]`` is horizontal whitespace.
+_ENV_LINE_RE = re.compile(
+    r"""
+    ^[^\S\n]*
+    (?:
+        \#[^\n]*
+      | (?:export[^\S\n]+)?(?P<key>[^=\n]*?)[^\S\n]*=[^\S\n]*
+        (?:
+            "(?P<double>[^\n]*)"
+          | '(?P<single>[^\n]*)'
+          | (?P<unterminated>["'][^\n]*?)
+          | (?P<bare>[^\n]*?)[^\S\n]*(?:[ ]\#[^\n]*)?
+        )
+      | (?P<invalid>[^\n]*?)
+    )
+    [^\S\n]*$
+    """,
+    re.VERBOSE,
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_env_file(
+    resolved_path: str, inode: int, mtime_ns: int, ctime_ns: int, size: int, encoding: str
+) -> dict[str, str]:
+    # The stat fields only participate in the cache key so that edits to the
+    # file invalidate previously parsed values.
+    values: dict[str, str] = {}
+    with open(resolved_path, encoding=encoding) as handle:
+        for lineno, raw_line in enumerate(handle, start=1):
+            match = _ENV_LINE_RE.match(raw_line)
+            key = match.group("key")
+            if key is None:
+                if match.group("invalid"):
+                    raise ConfigError(
+                        f"Invalid environment line {lineno}: {raw_line.rstrip()!r}"
+                    )
+                continue
+
+            if not key:
+                raise ConfigError(
+                    f"Missing key in environment line {lineno}: {raw_line.rstrip()!r}"
+                )
+
+            if match.group("unterminated") is not None:
+                raise ConfigError(
+                    f"Unterminated quoted value in line {lineno}: {raw_line.rstrip()!r}"
+                )
+
+            double, single, bare = match.group("double", "single", "bare")
+            values[key] = double if double is not None else single if single is not None else bare
+
+    return values
+
+
 def load_env_file(path: os.PathLike[str] | str, *, encoding: str = "utf-8") -> dict[str, str]:
-    """Parse a ``.env`` style file and return its key/value pairs."""
+    """Parse a ``.env`` style file and return its key/value pairs.
+
+    Parsed values are cached per resolved path and invalidated when the file's
+    inode, modification time, status-change time or size changes. An in-place
+    rewrite of the same size that lands within the filesystem's timestamp
+    granularity still goes unnoticed; call :func:`clear_env_file_cache` after
+    such an edit.
+    """
 
     env_path = Path(path)
+    resolved = os.path.realpath(env_path)
     try:
-        lines = env_path.read_text(encoding=encoding).splitlines()
-    except FileNotFoundError as exc:  # pragma: no cover - Path raises FileNotFoundError
+        stat = os.stat(resolved)
+    except FileNotFoundError as exc:
         raise ConfigError(f"Environment file not found: {env_path}") from exc
 
-    values: dict[str, str] = {}
-    for raw_line in lines:
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-
-        if line.startswith("export "):
-            line = line[len("export ") :].lstrip()
-
-        key, sep, value = line.partition("=")
-        if not sep:
-            raise ConfigError(f"Invalid environment line: {raw_line!r}")
-
-        key = key.strip()
-        if not key:
-            raise ConfigError(f"Missing key in environment line: {raw_line!r}")
-
-        value = value.strip()
-        if not value:
-            values[key] = ""
-            continue
-
-        if value[0] in {'"', "'"}:
-            quote = value[0]
-            if len(value) < 2 or value[-1] != quote:
-                raise ConfigError(f"Unterminated quoted value in line: {raw_line!r}")
-            value = value[1:-1]
-        else:
-            comment_index = value.find(" #")
-            if comment_index != -1:
-                value = value[:comment_index].rstrip()
-
-        values[key] = value
+    return dict(
+        _parse_env_file(
+            resolved, stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, encoding
+        )
+    )
 
-    return values
+
+def clear_env_file_cache() -> None:
+    """Drop the values cached by :func:`load_env_file`."""
+
+    _parse_env_file.cache_clear()
 
 
 def load_config_from_env_file(
@@ -241,7 +360,7 @@ def load_config_from_env_file(
     """Load :class:`ApplicationConfig` from a ``.env`` file."""
 
     file_values = load_env_file(path)
-    base_values = dict(_read_env(base_env))
+    base_values = dict(base_env if base_env is not None else os.environ)
 
     if override_existing:
         merged: dict[str, str] = {**base_values, **file_values}
@@ -255,6 +374,8 @@ __all__ = [
     "ApplicationConfig",
     "ConfigError",
     "SlackConfig",
+    "clear_config_cache",
+    "clear_env_file_cache",
     "load_config",
     "load_config_from_env_file",
     "load_env_file",
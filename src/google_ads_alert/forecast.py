@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import calendar
+import functools
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
@@ -9,10 +11,28 @@ from typing import Optional
 from zoneinfo import ZoneInfo
 
 
-DEFAULT_TZ = ZoneInfo("Asia/Tokyo")
+DEFAULT_TZ_NAME = "Asia/Tokyo"
 
 
-@dataclass(frozen=True)
+@functools.lru_cache(maxsize=64)
+def _cached_zoneinfo(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_tz() -> ZoneInfo:
+    return _cached_zoneinfo(DEFAULT_TZ_NAME)
+
+
+def __getattr__(name: str) -> object:
+    # ``DEFAULT_TZ`` is resolved on first use so importing this module does not
+    # load tzdata.
+    if name == "DEFAULT_TZ":
+        return _get_default_tz()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@dataclass(frozen=True, slots=True)
 class DailyForecastInput:
     """Parameters required to build a day-end spend projection."""
 
@@ -22,7 +42,7 @@ class DailyForecastInput:
     timezone: ZoneInfo | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyForecastResult:
     """Result of a daily projection calculation."""
 
@@ -35,7 +55,7 @@ class DailyForecastResult:
     budget_utilization: Optional[float]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonthlyPaceInput:
     """Parameters for the month-to-date pacing calculation."""
 
@@ -45,7 +65,7 @@ class MonthlyPaceInput:
     timezone: ZoneInfo | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonthlyPaceResult:
     """Outcome of the month-to-date pacing calculation."""
 
@@ -82,15 +102,22 @@ class CombinedForecastResult:
     monthly_budget: Optional[float]
 
 
-def _coerce_timezone(tz: ZoneInfo | None) -> ZoneInfo:
-    return tz or DEFAULT_TZ
+def _coerce_timezone(tz: ZoneInfo | str | None) -> ZoneInfo:
+    if tz is None:
+        return _get_default_tz()
+    if isinstance(tz, str):
+        return _cached_zoneinfo(tz)
+    return tz
 
 
 def _localize_datetime(as_of: datetime, tz: ZoneInfo) -> datetime:
     """Return ``as_of`` as a timezone-aware datetime in ``tz``."""
 
-    if as_of.tzinfo is None:
+    tzinfo = as_of.tzinfo
+    if tzinfo is None:
         return as_of.replace(tzinfo=tz)
+    if tzinfo is tz:
+        return as_of
     return as_of.astimezone(tz)
 
 
@@ -148,13 +175,8 @@ def calculate_monthly_pace(params: MonthlyPaceInput) -> MonthlyPaceResult:
 
     tz = _coerce_timezone(params.timezone)
     localized = _localize_datetime(params.as_of, tz)
-    first_of_month = localized.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    if localized.month == 12:
-        next_month = localized.replace(year=localized.year + 1, month=1, day=1)
-    else:
-        next_month = localized.replace(month=localized.month + 1, day=1)
-    days_elapsed = (localized.date() - first_of_month.date()).days + 1
-    days_in_month = (next_month.date() - first_of_month.date()).days
+    days_elapsed = localized.day
+    _, days_in_month = calendar.monthrange(localized.year, localized.month)
 
     average_daily_spend = params.month_to_date_spend / max(days_elapsed, 1)
     projected_month_end_spend = average_daily_spend * days_in_month
@@ -10,25 +10,20 @@ dependency on ``google-ads``.
 
 from __future__ import annotations
 
+import functools
 import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Callable, Iterable, Protocol
+from datetime import date, datetime, timedelta, tzinfo
+from typing import Callable, Iterable, Protocol, TypeVar
 
 from zoneinfo import ZoneInfo
 
-from .forecast import _coerce_timezone
+from .forecast import _coerce_timezone, _localize_datetime as _localize
 
+_T = TypeVar("_T")
 
-def _localize(as_of: datetime, tz: ZoneInfo) -> datetime:
-    """Return ``as_of`` localized to ``tz`` without altering the moment."""
 
-    if as_of.tzinfo is None:
-        return as_of.replace(tzinfo=tz)
-    return as_of.astimezone(tz)
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoogleAdsCredentials:
     """Bundle of OAuth related fields required by the Google Ads API."""
 
@@ -39,7 +34,7 @@ class GoogleAdsCredentials:
     login_customer_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GoogleAdsClientConfig:
     """Configuration values shared across Google Ads API calls."""
 
@@ -49,7 +44,7 @@ class GoogleAdsClientConfig:
     endpoint: str = "https://googleads.googleapis.com"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     """Behavioral controls for retrying failed Google Ads API calls."""
 
@@ -73,8 +68,18 @@ class RetryConfig:
 
         return isinstance(error, self.retryable_exceptions)
 
+    def backoff_delays(self) -> tuple[float, ...]:
+        """Return the sleep before each retry, i.e. ``max_attempts - 1`` values."""
+
+        delays: list[float] = []
+        delay = self.initial_backoff_seconds
+        for _ in range(self.max_attempts - 1):
+            delays.append(delay)
+            delay *= self.backoff_multiplier
+        return tuple(delays)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class QueryRange:
     """Datetime window used for GAQL time based filtering."""
 
@@ -82,7 +87,7 @@ class QueryRange:
     end: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyCostSummary:
     """Aggregated spend metrics for a daily Google Ads report."""
 
@@ -98,7 +103,7 @@ class DailyCostSummary:
         return self.total_cost_micros / 1_000_000
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonthToDateCostSummary:
     """Aggregated spend metrics for the month-to-date reporting window."""
 
@@ -121,16 +126,35 @@ class GoogleAdsSearchTransport(Protocol):
         """Execute ``query`` for ``customer_id`` and yield decoded rows."""
 
 
+@functools.lru_cache(maxsize=8)
+def _daily_range_for_date(day: date, tz: tzinfo) -> QueryRange:
+    day_start = datetime(day.year, day.month, day.day, tzinfo=tz)
+    return QueryRange(start=day_start, end=day_start + timedelta(days=1))
+
+
+@functools.lru_cache(maxsize=8)
+def _month_to_date_range_for_date(day: date, tz: tzinfo) -> QueryRange:
+    month_start = datetime(day.year, day.month, 1, tzinfo=tz)
+    return QueryRange(start=month_start, end=_daily_range_for_date(day, tz).end)
+
+
+# Ranges depend only on the local date and zone, so repeated runs on the same
+# day share one cached ``QueryRange``.
+def _daily_range_from_localized(localized: datetime) -> QueryRange:
+    return _daily_range_for_date(localized.date(), localized.tzinfo)
+
+
+def _month_to_date_range_from_localized(localized: datetime) -> QueryRange:
+    return _month_to_date_range_for_date(localized.date(), localized.tzinfo)
+
+
 def build_daily_query_range(
     as_of: datetime, timezone: ZoneInfo | None = None
 ) -> QueryRange:
     """Return a reporting window spanning the local calendar day of ``as_of``."""
 
     tz = _coerce_timezone(timezone)
-    localized = _localize(as_of, tz)
-    day_start = localized.replace(hour=0, minute=0, second=0, microsecond=0)
-    day_end = day_start + timedelta(days=1)
-    return QueryRange(start=day_start, end=day_end)
+    return _daily_range_from_localized(_localize(as_of, tz))
 
 
 def build_month_to_date_query_range(
@@ -139,12 +163,16 @@ def build_month_to_date_query_range(
     """Return a reporting window covering the month-to-date span of ``as_of``."""
 
     tz = _coerce_timezone(timezone)
-    localized = _localize(as_of, tz)
-    month_start = localized.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    next_day = localized.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
-        days=1
+    return _month_to_date_range_from_localized(_localize(as_of, tz))
+
+
+@functools.lru_cache(maxsize=64)
+def _build_cost_query_for_dates(start_date: date, end_date: date) -> str:
+    return (
+        "SELECT segments.date, metrics.cost_micros "
+        "FROM customer "
+        f"WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'"
     )
-    return QueryRange(start=month_start, end=next_day)
 
 
 def build_cost_query(query_range: QueryRange) -> str:
@@ -153,22 +181,19 @@ def build_cost_query(query_range: QueryRange) -> str:
     start_date = query_range.start.date()
     # ``end`` is exclusive, therefore subtract one day to get the inclusive end
     end_date = (query_range.end - timedelta(days=1)).date()
-    return (
-        "SELECT segments.date, metrics.cost_micros "
-        "FROM customer "
-        f"WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'"
-    )
+    return _build_cost_query_for_dates(start_date, end_date)
 
 
 def _extract_cost_micros(row: dict) -> int:
     """Best effort extraction of ``metrics.cost_micros`` from ``row``."""
 
-    value = row
-    for key in ("metrics", "cost_micros"):
-        if isinstance(value, dict) and key in value:
-            value = value[key]
-        else:
-            return 0
+    try:
+        value = row["metrics"]["cost_micros"]
+    except (KeyError, TypeError, IndexError):
+        return 0
+    # Decoded API rows almost always carry a plain ``int``.
+    if type(value) is int:
+        return value
 
     if isinstance(value, str):
         try:
@@ -180,6 +205,16 @@ def _extract_cost_micros(row: dict) -> int:
     return 0
 
 
+def _extract_segment_date(row: dict) -> str | None:
+    """Return ``segments.date`` from ``row`` when present."""
+
+    try:
+        value = row["segments"]["date"]
+    except (KeyError, TypeError, IndexError):
+        return None
+    return value if isinstance(value, str) else None
+
+
 class GoogleAdsCostService:
     """Utility wrapper that aggregates daily spend using a transport backend."""
 
@@ -195,39 +230,54 @@ class GoogleAdsCostService:
         self._retry_config = retry_config or RetryConfig()
         self._sleep = sleep or time.sleep
 
-    def _execute_cost_query(self, query_range: QueryRange) -> int:
-        query = build_cost_query(query_range)
-
-        attempt = 0
-        delay = self._retry_config.initial_backoff_seconds
-        last_error: Exception | None = None
-
-        while attempt < self._retry_config.max_attempts:
-            attempt += 1
+    def _sum_cost_micros(self, customer_id: str, query: str) -> int:
+        # ``sum``/``map`` keep the per-row aggregation loop in C.
+        return sum(map(_extract_cost_micros, self._transport.search(customer_id, query)))
+
+    def _split_cost_micros(
+        self, customer_id: str, query: str, day: str
+    ) -> tuple[int | None, int]:
+        # The day's share is ``None`` when any row lacks ``segments.date``:
+        # such rows cannot be attributed to a day, so the split is unknown.
+        day_micros = 0
+        total_micros = 0
+        segmented = True
+        for row in self._transport.search(customer_id, query):
+            micros = _extract_cost_micros(row)
+            total_micros += micros
+            row_day = _extract_segment_date(row)
+            if row_day is None:
+                segmented = False
+            elif row_day == day:
+                day_micros += micros
+        return (day_micros if segmented else None), total_micros
+
+    def _with_retries(self, attempt: Callable[[], _T]) -> _T:
+        retry_config = self._retry_config
+        for delay in retry_config.backoff_delays():
             try:
-                total_micros = 0
-                for row in self._transport.search(self._config.customer_id, query):
-                    total_micros += _extract_cost_micros(row)
-                return total_micros
+                return attempt()
             except Exception as exc:
-                last_error = exc
-                if not self._retry_config.is_retryable(exc) or attempt >= self._retry_config.max_attempts:
+                if not retry_config.is_retryable(exc):
                     raise
+            if delay > 0:
+                self._sleep(delay)
 
-                if delay > 0:
-                    self._sleep(delay)
-                delay *= self._retry_config.backoff_multiplier
+        # Final attempt: any error propagates to the caller.
+        return attempt()
 
-        if last_error is not None:
-            raise last_error
-        raise RuntimeError("Cost query failed without executing")
+    def _execute_cost_query(self, query_range: QueryRange) -> int:
+        # Built once; every retry attempt reuses the same query string.
+        query = build_cost_query(query_range)
+        customer_id = self._config.customer_id
+        return self._with_retries(lambda: self._sum_cost_micros(customer_id, query))
 
     def fetch_daily_cost(self, as_of: datetime) -> DailyCostSummary:
         """Retrieve and aggregate the spend for the day of ``as_of``."""
 
         tz = _coerce_timezone(self._config.timezone)
         localized_as_of = _localize(as_of, tz)
-        query_range = build_daily_query_range(localized_as_of, tz)
+        query_range = _daily_range_from_localized(localized_as_of)
         total_micros = self._execute_cost_query(query_range)
 
         return DailyCostSummary(
@@ -242,7 +292,7 @@ class GoogleAdsCostService:
 
         tz = _coerce_timezone(self._config.timezone)
         localized_as_of = _localize(as_of, tz)
-        query_range = build_month_to_date_query_range(localized_as_of, tz)
+        query_range = _month_to_date_range_from_localized(localized_as_of)
         total_micros = self._execute_cost_query(query_range)
 
         return MonthToDateCostSummary(
@@ -252,6 +302,43 @@ class GoogleAdsCostService:
             total_cost_micros=total_micros,
         )
 
+    def fetch_costs(self, as_of: datetime) -> tuple[DailyCostSummary, MonthToDateCostSummary]:
+        """Retrieve the daily and month-to-date spend, in one query when possible.
+
+        The month-to-date range already contains the current day, so its rows
+        are split by ``segments.date`` instead of issuing a second request.
+        Transports that return rows without that segment fall back to a
+        separate daily query.
+        """
+
+        tz = _coerce_timezone(self._config.timezone)
+        localized_as_of = _localize(as_of, tz)
+        daily_range = _daily_range_from_localized(localized_as_of)
+        month_range = _month_to_date_range_from_localized(localized_as_of)
+        query = build_cost_query(month_range)
+        customer_id = self._config.customer_id
+        day = daily_range.start.date().isoformat()
+        daily_micros, month_micros = self._with_retries(
+            lambda: self._split_cost_micros(customer_id, query, day)
+        )
+        if daily_micros is None:
+            daily_micros = self._execute_cost_query(daily_range)
+
+        return (
+            DailyCostSummary(
+                as_of=localized_as_of,
+                report_start=daily_range.start,
+                report_end=daily_range.end,
+                total_cost_micros=daily_micros,
+            ),
+            MonthToDateCostSummary(
+                as_of=localized_as_of,
+                report_start=month_range.start,
+                report_end=month_range.end,
+                total_cost_micros=month_micros,
+            ),
+        )
+
 
 __all__ = [
     "DailyCostSummary",
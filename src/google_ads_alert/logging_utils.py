@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import IO
@@ -22,15 +23,34 @@ class _TimezoneAwareFormatter(logging.Formatter):
         default_fmt = fmt or DEFAULT_LOG_FORMAT
         super().__init__(default_fmt, datefmt)
         self._timezone = timezone
+        # ``(second, datefmt, rendered)`` of the last timestamp; stored as one
+        # tuple so concurrent handlers never observe a torn update.
+        self._last_time: tuple[int, str, str] = (-1, "", "")
 
     def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802 - required by logging.Formatter
-        dt = datetime.fromtimestamp(record.created, self._timezone)
-        if datefmt:
-            return dt.strftime(datefmt)
-        return dt.strftime(DEFAULT_LOG_DATEFMT)
-
+        datefmt = datefmt or DEFAULT_LOG_DATEFMT
+        second = int(record.created)
+        last_second, last_datefmt, rendered = self._last_time
+        if second == last_second and datefmt == last_datefmt:
+            return rendered
 
-@dataclass(frozen=True)
+        dt = datetime.fromtimestamp(record.created, self._timezone)
+        if datefmt == DEFAULT_LOG_DATEFMT:
+            # Same output as ``strftime(DEFAULT_LOG_DATEFMT)`` without walking the
+            # format string.
+            rendered = (
+                f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+                f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} {dt.tzname() or ''}"
+            )
+        else:
+            rendered = dt.strftime(datefmt)
+        # Sub-second directives change within a second and cannot be reused.
+        if "%f" not in datefmt:
+            self._last_time = (second, datefmt, rendered)
+        return rendered
+
+
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Configuration payload for :func:`configure_logging`."""
 
@@ -41,6 +61,10 @@ class LoggingConfig:
     stream: IO[str] | None = None
 
 
+# The config and handler installed by the most recent ``configure_logging`` call.
+_LAST_CONFIGURED: tuple[LoggingConfig, logging.StreamHandler] | None = None
+
+
 def _clear_handlers(logger: logging.Logger) -> None:
     for handler in list(logger.handlers):
         logger.removeHandler(handler)
@@ -50,10 +74,23 @@ def _clear_handlers(logger: logging.Logger) -> None:
 def configure_logging(config: LoggingConfig | None = None) -> logging.Logger:
     """Configure the project logger with timezone-aware formatting."""
 
-    cfg = config or LoggingConfig()
-    tz = _coerce_timezone(cfg.timezone)
+    global _LAST_CONFIGURED
 
+    cfg = config or LoggingConfig()
     logger = logging.getLogger("google_ads_alert")
+
+    if _LAST_CONFIGURED is not None:
+        last_cfg, last_handler = _LAST_CONFIGURED
+        if (
+            last_cfg == cfg
+            and logger.handlers == [last_handler]
+            and last_handler.stream is (cfg.stream or sys.stderr)
+        ):
+            # Same configuration and our handler is still installed: keep it
+            # instead of closing and rebuilding an identical one.
+            return logger
+
+    tz = _coerce_timezone(cfg.timezone)
     logger.setLevel(cfg.level)
     logger.propagate = False
 
@@ -69,6 +106,7 @@ def configure_logging(config: LoggingConfig | None = None) -> logging.Logger:
         )
     )
     logger.addHandler(handler)
+    _LAST_CONFIGURED = (cfg, handler)
 
     return logger
 
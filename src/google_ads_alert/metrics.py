@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import functools
 import json
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import date, datetime, timezone, tzinfo
 from enum import Enum
+from operator import add, attrgetter
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+try:  # Optional: faster JSON decoding straight from bytes.
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - depends on environment
+    orjson = None
 
 
 class MetricsLoadError(ValueError):
@@ -22,7 +30,7 @@ class AlertRunStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlertRunRecord:
     """Represents a single scheduled execution of the alert workflow."""
 
@@ -34,7 +42,7 @@ class AlertRunRecord:
     data_fresh: bool | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SliMeasurement:
     """Computed ratio for a specific service level indicator."""
 
@@ -45,7 +53,7 @@ class SliMeasurement:
     value: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SliReport:
     """Aggregate SLI metrics for a set of alert run records."""
 
@@ -64,7 +72,7 @@ class SliReport:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SliReportGroup:
     """Container holding grouped SLI results for rendering or serialisation."""
 
@@ -81,25 +89,34 @@ def _parse_datetime(value: object, *, field: str, required: bool) -> datetime |
     if not isinstance(value, str):
         raise MetricsLoadError(f"Field '{field}' must be an ISO-8601 string")
     try:
-        parsed = datetime.fromisoformat(value)
+        return _parse_iso_utc(value)
     except ValueError as exc:
         raise MetricsLoadError(f"Invalid datetime for field '{field}': {value}") from exc
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_utc(value: str) -> datetime:
+    # Run histories repeat the same schedule slots, so identical strings are
+    # common. Naive values are assumed to be UTC.
+    parsed = datetime.fromisoformat(value)
     if parsed.tzinfo is None:
         return parsed.replace(tzinfo=timezone.utc)
     return parsed
 
 
+_STATUS_BY_VALUE: dict[str, AlertRunStatus] = {item.value: item for item in AlertRunStatus}
+
+
 def _parse_status(value: object) -> AlertRunStatus:
     if not isinstance(value, str):
         raise MetricsLoadError("Field 'status' must be a string")
-    normalized = value.strip().lower()
-    try:
-        return AlertRunStatus(normalized)
-    except ValueError as exc:
-        allowed = ", ".join(sorted(item.value for item in AlertRunStatus))
+    status = _STATUS_BY_VALUE.get(value) or _STATUS_BY_VALUE.get(value.strip().lower())
+    if status is None:
+        allowed = ", ".join(sorted(_STATUS_BY_VALUE))
         raise MetricsLoadError(
             f"Unsupported status '{value}'. Expected one of: {allowed}."
-        ) from exc
+        )
+    return status
 
 
 def _parse_optional_bool(value: object, *, field: str) -> bool | None:
@@ -110,13 +127,28 @@ def _parse_optional_bool(value: object, *, field: str) -> bool | None:
     raise MetricsLoadError(f"Field '{field}' must be a boolean if provided")
 
 
+_RECORD_FIELDS = (
+    "scheduled_for",
+    "status",
+    "started_at",
+    "completed_at",
+    "forecast_success",
+    "data_fresh",
+)
+
+
 def _record_from_dict(payload: dict[str, object]) -> AlertRunRecord:
-    scheduled_for = _parse_datetime(payload.get("scheduled_for"), field="scheduled_for", required=True)
-    status = _parse_status(payload.get("status"))
-    started_at = _parse_datetime(payload.get("started_at"), field="started_at", required=False)
-    completed_at = _parse_datetime(payload.get("completed_at"), field="completed_at", required=False)
-    forecast_success = _parse_optional_bool(payload.get("forecast_success"), field="forecast_success")
-    data_fresh = _parse_optional_bool(payload.get("data_fresh"), field="data_fresh")
+    # ``map(payload.get, ...)`` fetches every field in one C-level loop while
+    # still tolerating absent optional keys (which ``itemgetter`` would not).
+    scheduled_raw, status_raw, started_raw, completed_raw, forecast_raw, fresh_raw = map(
+        payload.get, _RECORD_FIELDS
+    )
+    scheduled_for = _parse_datetime(scheduled_raw, field="scheduled_for", required=True)
+    status = _parse_status(status_raw)
+    started_at = _parse_datetime(started_raw, field="started_at", required=False)
+    completed_at = _parse_datetime(completed_raw, field="completed_at", required=False)
+    forecast_success = _parse_optional_bool(forecast_raw, field="forecast_success")
+    data_fresh = _parse_optional_bool(fresh_raw, field="data_fresh")
 
     return AlertRunRecord(
         scheduled_for=scheduled_for,
@@ -128,33 +160,52 @@ def _record_from_dict(payload: dict[str, object]) -> AlertRunRecord:
     )
 
 
-def load_alert_run_records_from_jsonl(path: str | Path) -> list[AlertRunRecord]:
-    """Load :class:`AlertRunRecord` entries from a JSON Lines file."""
+def _loads_json_line(line: bytes) -> object:
+    # ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so callers
+    # handle both decoders the same way.
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def iter_alert_run_records_from_jsonl(path: str | Path) -> Iterator[AlertRunRecord]:
+    """Yield :class:`AlertRunRecord` entries from a JSON Lines file.
+
+    The file is read one line at a time, so memory use does not grow with the
+    size of the run history.
+    """
 
     file_path = Path(path)
     try:
-        lines = file_path.read_text(encoding="utf-8").splitlines()
+        handle = file_path.open("rb")
     except FileNotFoundError as exc:  # pragma: no cover - depends on filesystem
         raise MetricsLoadError(f"Run history file not found: {file_path}") from exc
 
-    records: list[AlertRunRecord] = []
-    for index, raw_line in enumerate(lines, start=1):
-        line = raw_line.strip()
-        if not line:
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError as exc:
-            raise MetricsLoadError(
-                f"Invalid JSON payload on line {index}: {exc.msg}"
-            ) from exc
-        if not isinstance(payload, dict):
-            raise MetricsLoadError(
-                f"Each line must be a JSON object (line {index})"
-            )
-        records.append(_record_from_dict(payload))
-
-    return records
+    with handle:
+        for index, raw_line in enumerate(handle, start=1):
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                payload = _loads_json_line(line)
+            except json.JSONDecodeError as exc:
+                raise MetricsLoadError(
+                    f"Invalid JSON payload on line {index}: {exc.msg}"
+                ) from exc
+            if not isinstance(payload, dict):
+                raise MetricsLoadError(
+                    f"Each line must be a JSON object (line {index})"
+                )
+            yield _record_from_dict(payload)
+
+
+def load_alert_run_records_from_jsonl(path: str | Path) -> list[AlertRunRecord]:
+    """Load :class:`AlertRunRecord` entries from a JSON Lines file."""
+
+    return list(iter_alert_run_records_from_jsonl(path))
+
+
+_scheduled_for = attrgetter("scheduled_for")
 
 
 def filter_records_by_schedule(
@@ -162,12 +213,16 @@ def filter_records_by_schedule(
     *,
     start: datetime | None = None,
     end: datetime | None = None,
+    assume_sorted: bool = False,
 ) -> list[AlertRunRecord]:
     """Filter ``records`` by ``scheduled_for`` bounds.
 
     The ``start``/``end`` parameters accept naive or timezone-aware datetimes.
     Naive values are assumed to be in UTC for consistency with
     :func:`load_alert_run_records_from_jsonl`.
+
+    When ``assume_sorted`` is true, ``records`` must be a sequence ordered by
+    ``scheduled_for``; the bounds are then located by binary search.
     """
 
     def _normalize(value: datetime) -> datetime:
@@ -181,78 +236,140 @@ def filter_records_by_schedule(
     if normalized_start and normalized_end and normalized_start > normalized_end:
         raise ValueError("start must be earlier than end")
 
-    filtered: list[AlertRunRecord] = []
-    for record in records:
-        if normalized_start and record.scheduled_for < normalized_start:
-            continue
-        if normalized_end and record.scheduled_for > normalized_end:
-            continue
-        filtered.append(record)
-
-    return filtered
-
-
-def _boolean_measure(
-    name: str,
-    label: str,
-    values: Sequence[bool],
-) -> SliMeasurement:
-    numerator = sum(1 for value in values if value)
-    denominator = len(values)
+    if assume_sorted:
+        ordered = records if isinstance(records, Sequence) else list(records)
+        lo = (
+            bisect_left(ordered, normalized_start, key=_scheduled_for)
+            if normalized_start
+            else 0
+        )
+        hi = (
+            bisect_right(ordered, normalized_end, key=_scheduled_for)
+            if normalized_end
+            else len(ordered)
+        )
+        return list(ordered[lo:hi])
+
+    # Pick the comparison once rather than re-checking both bounds per record.
+    if normalized_start and normalized_end:
+        return [
+            record
+            for record in records
+            if normalized_start <= record.scheduled_for <= normalized_end
+        ]
+    if normalized_start:
+        return [record for record in records if record.scheduled_for >= normalized_start]
+    if normalized_end:
+        return [record for record in records if record.scheduled_for <= normalized_end]
+    return list(records)
+
+
+# Measurements are immutable and grouped reports repeat the same counts (e.g.
+# every day delivering 3/3), so identical measurements share one instance.
+@functools.lru_cache(maxsize=1024)
+def _ratio_measure(name: str, label: str, numerator: int, denominator: int) -> SliMeasurement:
     value = numerator / denominator if denominator else 0.0
     return SliMeasurement(name=name, label=label, numerator=numerator, denominator=denominator, value=value)
 
 
+# (total, delivered, delivery_total, forecast_ok, forecast_total, fresh, fresh_total)
+_Tally = tuple[int, int, int, int, int, int, int]
+
+
+def _tally_records(records: Iterable[AlertRunRecord]) -> _Tally:
+    # Single pass over the records, counting each indicator's numerator and
+    # denominator instead of materialising one list per indicator.
+    total = 0
+    delivered = delivery_total = 0
+    forecast_ok = forecast_total = 0
+    fresh = fresh_total = 0
+    for record in records:
+        total += 1
+        status = record.status
+        if status is AlertRunStatus.SUCCESS:
+            delivered += 1
+            delivery_total += 1
+        elif status is AlertRunStatus.FAILURE:
+            delivery_total += 1
+
+        forecast_success = record.forecast_success
+        if forecast_success is not None:
+            forecast_total += 1
+            if forecast_success:
+                forecast_ok += 1
+
+        data_fresh = record.data_fresh
+        if data_fresh is not None:
+            fresh_total += 1
+            if data_fresh:
+                fresh += 1
+
+    return total, delivered, delivery_total, forecast_ok, forecast_total, fresh, fresh_total
+
+
+def _report_from_tally(tally: _Tally, generated_at: datetime) -> SliReport:
+    total, delivered, delivery_total, forecast_ok, forecast_total, fresh, fresh_total = tally
+    return SliReport(
+        generated_at=generated_at,
+        total_records=total,
+        notification_delivery=_ratio_measure(
+            "notification_delivery",
+            "Notification delivery success rate",
+            delivered,
+            delivery_total,
+        ),
+        forecast_success=_ratio_measure(
+            "forecast_success",
+            "Forecast processing success rate",
+            forecast_ok,
+            forecast_total,
+        ),
+        data_freshness=_ratio_measure(
+            "data_freshness",
+            "Data freshness rate",
+            fresh,
+            fresh_total,
+        ),
+    )
+
+
 def compute_sli_report(
-    records: Sequence[AlertRunRecord],
+    records: Iterable[AlertRunRecord],
     *,
     generated_at: datetime | None = None,
 ) -> SliReport:
-    """Compute core SLI metrics from ``records``."""
+    """Compute core SLI metrics from ``records``.
+
+    ``records`` is consumed once, so it may be the generator returned by
+    :func:`iter_alert_run_records_from_jsonl`.
+    """
 
     timestamp = generated_at or datetime.now(timezone.utc)
-    delivery_candidates = [
-        record
-        for record in records
-        if record.status in {AlertRunStatus.SUCCESS, AlertRunStatus.FAILURE}
-    ]
-    delivery_values = [record.status is AlertRunStatus.SUCCESS for record in delivery_candidates]
+    return _report_from_tally(_tally_records(records), timestamp)
 
-    forecast_values = [
-        record.forecast_success
-        for record in records
-        if record.forecast_success is not None
-    ]
 
-    data_fresh_values = [
-        record.data_fresh
-        for record in records
-        if record.data_fresh is not None
-    ]
+@dataclass(frozen=True, slots=True)
+class _Grouping:
+    """How one ``group_by`` value buckets local dates and titles its groups."""
 
-    delivery_measure = _boolean_measure(
-        "notification_delivery",
-        "Notification delivery success rate",
-        delivery_values,
-    )
-    forecast_measure = _boolean_measure(
-        "forecast_success",
-        "Forecast processing success rate",
-        [bool(value) for value in forecast_values],
-    )
-    data_fresh_measure = _boolean_measure(
-        "data_freshness",
-        "Data freshness rate",
-        [bool(value) for value in data_fresh_values],
-    )
+    key: Callable[[date], Any]
+    label: Callable[[Any], str]
+    title: str
 
-    return SliReport(
-        generated_at=timestamp,
-        total_records=len(records),
-        notification_delivery=delivery_measure,
-        forecast_success=forecast_measure,
-        data_freshness=data_fresh_measure,
-    )
+
+_GROUPINGS: dict[str, _Grouping] = {
+    "day": _Grouping(lambda day: day, lambda key: key.isoformat(), "Date"),
+    "week": _Grouping(
+        lambda day: day.isocalendar()[:2],
+        lambda key: f"{key[0]}-W{key[1]:02d}",
+        "Week",
+    ),
+    "month": _Grouping(
+        lambda day: (day.year, day.month),
+        lambda key: f"{key[0]}-{key[1]:02d}",
+        "Month",
+    ),
+}
 
 
 def compute_grouped_sli_reports(
@@ -276,65 +393,54 @@ def compute_grouped_sli_reports(
         report = compute_sli_report(records, generated_at=timestamp)
         return [SliReportGroup(key="overall", label="Overall", report=report)]
 
-    if normalized_group not in {"day", "week", "month"}:
+    grouping = _GROUPINGS.get(normalized_group)
+    if grouping is None:
         raise ValueError(f"Unsupported group_by value: {group_by}")
 
     tz = grouping_timezone or timezone.utc
 
-    if normalized_group == "day":
-        buckets: dict[date, list[AlertRunRecord]] = {}
-        for record in records:
-            scheduled = record.scheduled_for
-            if scheduled.tzinfo is None:
-                scheduled = scheduled.replace(tzinfo=timezone.utc)
-            local_dt = scheduled.astimezone(tz)
-            buckets.setdefault(local_dt.date(), []).append(record)
-
-        grouped: list[SliReportGroup] = []
-        for bucket_key in sorted(buckets):
-            day_records = buckets[bucket_key]
-            label = bucket_key.isoformat()
-            report = compute_sli_report(day_records, generated_at=timestamp)
-            grouped.append(SliReportGroup(key=label, label=label, report=report))
-        return grouped
-
-    if normalized_group == "week":
-        buckets: dict[tuple[int, int], list[AlertRunRecord]] = {}
-        for record in records:
-            scheduled = record.scheduled_for
-            if scheduled.tzinfo is None:
-                scheduled = scheduled.replace(tzinfo=timezone.utc)
-            local_dt = scheduled.astimezone(tz)
-            iso_year, iso_week, _ = local_dt.isocalendar()
-            buckets.setdefault((iso_year, iso_week), []).append(record)
-
-        grouped = []
-        for iso_year, iso_week in sorted(buckets):
-            week_records = buckets[(iso_year, iso_week)]
-            label = f"{iso_year}-W{iso_week:02d}"
-            report = compute_sli_report(week_records, generated_at=timestamp)
-            grouped.append(SliReportGroup(key=label, label=label, report=report))
-
-        return grouped
-
-    buckets: dict[tuple[int, int], list[AlertRunRecord]] = {}
+    # Bucket by local calendar date first; week and month keys are derived from
+    # each distinct date rather than recomputed for every record. Histories
+    # repeat the same schedule slots (and ``_parse_iso_utc`` hands out shared
+    # datetime objects), so each distinct timestamp is converted only once.
+    local_dates: dict[datetime, date] = {}
+    by_date: dict[date, list[AlertRunRecord]] = {}
     for record in records:
         scheduled = record.scheduled_for
-        if scheduled.tzinfo is None:
-            scheduled = scheduled.replace(tzinfo=timezone.utc)
-        local_dt = scheduled.astimezone(tz)
-        buckets.setdefault((local_dt.year, local_dt.month), []).append(record)
-
-    grouped = []
-    for year, month in sorted(buckets):
-        month_records = buckets[(year, month)]
-        label = f"{year}-{month:02d}"
-        report = compute_sli_report(month_records, generated_at=timestamp)
+        local_date = local_dates.get(scheduled)
+        if local_date is None:
+            aware = scheduled if scheduled.tzinfo is not None else scheduled.replace(tzinfo=timezone.utc)
+            local_date = local_dates[scheduled] = aware.astimezone(tz).date()
+        by_date.setdefault(local_date, []).append(record)
+
+    # Tally each date once; the counters are summed into buckets below, so no
+    # per-bucket record list is built.
+    date_tallies = map(_tally_records, by_date.values())
+
+    bucket_key, bucket_label = grouping.key, grouping.label
+    buckets: dict[object, _Tally] = {}
+    for local_date, tally in zip(by_date, date_tallies):
+        key = bucket_key(local_date)
+        previous = buckets.get(key)
+        if previous is not None:
+            tally = tuple(map(add, previous, tally))
+        buckets[key] = tally
+
+    grouped: list[SliReportGroup] = []
+    for key in sorted(buckets):
+        label = bucket_label(key)
+        report = _report_from_tally(buckets[key], timestamp)
         grouped.append(SliReportGroup(key=label, label=label, report=report))
-
     return grouped
 
 
+def _format_measurement(measurement: SliMeasurement) -> str:
+    return (
+        f"- {measurement.label}: {measurement.numerator}/{measurement.denominator} "
+        f"({format(measurement.value * 100, '.2f')}%)"
+    )
+
+
 def render_sli_report(report: SliReport) -> str:
     """Render ``report`` into a human readable summary."""
 
@@ -344,13 +450,7 @@ def render_sli_report(report: SliReport) -> str:
         f"Records analyzed: {report.total_records}",
     ]
 
-    for measurement in report.measurements:
-        percent = measurement.value * 100
-        lines.append(
-            f"- {measurement.label}: {measurement.numerator}/{measurement.denominator} "
-            f"({percent:.2f}%)"
-        )
-
+    lines.extend(map(_format_measurement, report.measurements))
     return "\n".join(lines)
 
 
@@ -370,7 +470,8 @@ def render_grouped_sli_reports(
             return render_sli_report(empty_report)
         return render_sli_report(grouped[0].report)
 
-    if normalized_group not in {"day", "week", "month"}:
+    grouping = _GROUPINGS.get(normalized_group)
+    if grouping is None:
         raise ValueError(f"Unsupported group_by value: {group_by}")
 
     header = f"SLI report grouped by {normalized_group}"
@@ -380,34 +481,23 @@ def render_grouped_sli_reports(
     if not grouped:
         return "\n".join([header, "No records matched the selected filters."])
 
-    if normalized_group == "day":
-        label_title = "Date"
-    elif normalized_group == "week":
-        label_title = "Week"
-    else:
-        label_title = "Month"
-
+    title_prefix = f"{grouping.title}: "
     lines = [header]
+    append = lines.append
     for group in grouped:
-        lines.append("")
-        lines.append(f"{label_title}: {group.label}")
-        lines.append(f"Generated at: {group.report.generated_at.isoformat()}")
-        lines.append(f"Records analyzed: {group.report.total_records}")
-        for measurement in group.report.measurements:
-            percent = measurement.value * 100
-            lines.append(
-                f"- {measurement.label}: {measurement.numerator}/{measurement.denominator} "
-                f"({percent:.2f}%)"
-            )
+        report = group.report
+        append("")
+        append(title_prefix + group.label)
+        append("Generated at: " + report.generated_at.isoformat())
+        append(f"Records analyzed: {report.total_records}")
+        lines.extend(map(_format_measurement, report.measurements))
 
     return "\n".join(lines)
 
 
-def sli_report_to_dict(report: SliReport) -> dict[str, object]:
-    """Convert :class:`SliReport` into a JSON-serialisable dictionary."""
-
+def _sli_report_to_dict(report: SliReport, generated_at: str) -> dict[str, object]:
     return {
-        "generated_at": report.generated_at.isoformat(),
+        "generated_at": generated_at,
         "total_records": report.total_records,
         "measurements": [
             {
@@ -422,6 +512,12 @@ def sli_report_to_dict(report: SliReport) -> dict[str, object]:
     }
 
 
+def sli_report_to_dict(report: SliReport) -> dict[str, object]:
+    """Convert :class:`SliReport` into a JSON-serialisable dictionary."""
+
+    return _sli_report_to_dict(report, report.generated_at.isoformat())
+
+
 def grouped_sli_reports_to_dict(
     grouped: Sequence[SliReportGroup],
     *,
@@ -430,17 +526,25 @@ def grouped_sli_reports_to_dict(
 ) -> dict[str, object]:
     """Serialise grouped reports into a structured dictionary."""
 
-    payload: dict[str, object] = {
-        "group_by": group_by,
-        "groups": [
+    # Groups built by ``compute_grouped_sli_reports`` share one timestamp
+    # object, so only format it again when a different one turns up.
+    last_generated_at: datetime | None = None
+    iso = ""
+    groups: list[dict[str, object]] = []
+    for group in grouped:
+        generated_at = group.report.generated_at
+        if generated_at is not last_generated_at:
+            last_generated_at = generated_at
+            iso = generated_at.isoformat()
+        groups.append(
             {
                 "key": group.key,
                 "label": group.label,
-                "report": sli_report_to_dict(group.report),
+                "report": _sli_report_to_dict(group.report, iso),
             }
-            for group in grouped
-        ],
-    }
+        )
+
+    payload: dict[str, object] = {"group_by": group_by, "groups": groups}
 
     if timezone_label:
         payload["timezone"] = timezone_label
@@ -458,6 +562,7 @@ __all__ = [
     "compute_sli_report",
     "compute_grouped_sli_reports",
     "filter_records_by_schedule",
+    "iter_alert_run_records_from_jsonl",
     "load_alert_run_records_from_jsonl",
     "render_grouped_sli_reports",
     "render_sli_report",
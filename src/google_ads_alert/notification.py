@@ -23,19 +23,23 @@ class SlackNotificationOptions:
     include_average_daily_spend: bool = False
 
 
+_DEFAULT_OPTIONS = SlackNotificationOptions()
+
+
 def _format_currency(value: float, currency_symbol: str) -> str:
-    formatted = f"{value:,.2f}"
-    if formatted.endswith(".00"):
+    formatted = format(value, ",.2f")
+    if formatted[-3:] == ".00":
         formatted = formatted[:-3]
-    return f"{currency_symbol}{formatted}"
+    return currency_symbol + formatted
 
 
-def _format_gap(value: float, currency_symbol: str) -> str:
-    if value == 0:
-        return _format_currency(0, currency_symbol)
+# Indexed by ``(value > 0) - (value < 0) + 1``.
+_GAP_SIGNS = ("-", "", "+")
+
 
-    sign = "+" if value > 0 else "-"
-    return f"{sign}{_format_currency(abs(value), currency_symbol)}"
+def _format_gap(value: float, currency_symbol: str) -> str:
+    sign = _GAP_SIGNS[(value > 0) - (value < 0) + 1]
+    return sign + _format_currency(abs(value), currency_symbol)
 
 
 def _format_percentage(value: float) -> str:
@@ -53,6 +57,24 @@ def _format_optional_percentage(value: Optional[float], fallback: str = "—") -
     return _format_percentage(value)
 
 
+def _format_projection(
+    title: str,
+    projected: float,
+    budget: Optional[float],
+    gap: Optional[float],
+    progress: Optional[str],
+    currency_symbol: str,
+) -> str:
+    text = f"{title}\n{_format_currency(projected, currency_symbol)}"
+    if budget is not None and budget > 0:
+        text += f" / 予算 {_format_currency(budget, currency_symbol)}"
+        if gap is not None:
+            text += f" / 差分 {_format_gap(gap, currency_symbol)}"
+    if progress is not None:
+        text += f" / 進捗 {progress}"
+    return text
+
+
 def _daily_section(
     forecast: CombinedForecastResult, opts: SlackNotificationOptions
 ) -> Dict[str, List[Dict[str, str]] | str]:
@@ -69,23 +91,16 @@ def _daily_section(
     if daily.projected_spend is None:
         projection_text = "*当日24時予測*\n計算可能なデータが不足しています"
     else:
-        pieces = [
-            _format_currency(daily.projected_spend, currency_symbol),
-        ]
-        if forecast.daily_budget is not None and forecast.daily_budget > 0:
-            pieces.append(
-                f"予算 {_format_currency(forecast.daily_budget, currency_symbol)}"
-            )
-            if forecast.daily_budget_gap is not None:
-                pieces.append(
-                    f"差分 {_format_gap(forecast.daily_budget_gap, currency_symbol)}"
-                )
-        if daily.budget_utilization is not None:
-            pieces.append(
-                f"進捗 {_format_percentage(daily.budget_utilization)}"
-            )
-
-        projection_text = f"*当日24時予測*\n" + " / ".join(pieces)
+        projection_text = _format_projection(
+            "*当日24時予測*",
+            daily.projected_spend,
+            forecast.daily_budget,
+            forecast.daily_budget_gap,
+            None
+            if daily.budget_utilization is None
+            else _format_percentage(daily.budget_utilization),
+            currency_symbol,
+        )
 
     fields.append({"type": "mrkdwn", "text": projection_text})
 
@@ -116,22 +131,14 @@ def _monthly_section(
     )
     fields.append({"type": "mrkdwn", "text": days_text})
 
-    projected_pieces = [
-        _format_currency(monthly.projected_month_end_spend, currency_symbol),
-    ]
-    if forecast.monthly_budget is not None and forecast.monthly_budget > 0:
-        projected_pieces.append(
-            f"予算 {_format_currency(forecast.monthly_budget, currency_symbol)}"
-        )
-        if forecast.monthly_budget_gap is not None:
-            projected_pieces.append(
-                f"差分 {_format_gap(forecast.monthly_budget_gap, currency_symbol)}"
-            )
-    projected_pieces.append(
-        f"進捗 {_format_optional_percentage(monthly.budget_utilization)}"
+    projected_text = _format_projection(
+        "*月末着地予測*",
+        monthly.projected_month_end_spend,
+        forecast.monthly_budget,
+        forecast.monthly_budget_gap,
+        _format_optional_percentage(monthly.budget_utilization),
+        currency_symbol,
     )
-
-    projected_text = "*月末着地予測*\n" + " / ".join(projected_pieces)
     fields.append({"type": "mrkdwn", "text": projected_text})
 
     if opts.include_average_daily_spend:
@@ -150,7 +157,8 @@ def build_slack_notification_payload(
 ) -> Dict[str, object]:
     """Render a Slack-compatible payload describing ``forecast``."""
 
-    opts = options or SlackNotificationOptions()
+    opts = options or _DEFAULT_OPTIONS
+    currency_symbol = opts.currency_symbol
     tz = _coerce_timezone(opts.timezone)
     as_of = forecast.daily.as_of
     timestamp = _format_timestamp(as_of, tz)
@@ -184,7 +192,7 @@ def build_slack_notification_payload(
     fallback_daily = (
         "日次予測計算不可"
         if forecast.daily.projected_spend is None
-        else _format_currency(forecast.daily.projected_spend, opts.currency_symbol)
+        else _format_currency(forecast.daily.projected_spend, currency_symbol)
     )
     fallback_monthly: str
     fallback_average: str | None = None
@@ -195,16 +203,16 @@ def build_slack_notification_payload(
         else:
             fallback_spend_rate = (
                 "1時間あたりの消化: "
-                f"{_format_currency(forecast.daily.spend_rate_per_hour, opts.currency_symbol)}/時"
+                f"{_format_currency(forecast.daily.spend_rate_per_hour, currency_symbol)}/時"
             )
 
     if opts.include_monthly_section:
         fallback_monthly = _format_currency(
-            forecast.monthly.projected_month_end_spend, opts.currency_symbol
+            forecast.monthly.projected_month_end_spend, currency_symbol
         )
         if opts.include_average_daily_spend:
             fallback_average = "平均日次消化: " + _format_currency(
-                forecast.monthly.average_daily_spend, opts.currency_symbol
+                forecast.monthly.average_daily_spend, currency_symbol
             ) + "/日"
     else:
         fallback_monthly = "—"
@@ -2,24 +2,27 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+import functools
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, replace
 from datetime import date, datetime, timedelta
+from itertools import chain
 
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from .forecast import _coerce_timezone
+from .forecast import _cached_zoneinfo, _coerce_timezone, _localize_datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyScheduleConfig:
     """Configuration for generating daily alert execution times.
 
     Attributes
     ----------
     timezone:
-        Target timezone for the generated run times. ``None`` falls back to
-        the project default (Asia/Tokyo).
+        Target timezone for the generated run times, as a ``ZoneInfo`` or an
+        IANA name. ``None`` falls back to the project default (Asia/Tokyo).
     start_hour:
         First hour (0-23) when the schedule may trigger. The exact first run
         will be aligned to this hour and ``start_minute``.
@@ -37,7 +40,7 @@ class DailyScheduleConfig:
         timezone.
     """
 
-    timezone: ZoneInfo | None = None
+    timezone: ZoneInfo | str | None = None
     start_hour: int = 8
     start_minute: int = 0
     end_hour: int = 20
@@ -55,19 +58,35 @@ def _validate_minute(minute: int) -> None:
         raise ValueError("Minute must be within the range 0-59")
 
 
-def _build_anchor_datetime(
-    target_date: date, hour: int, minute: int, tz: ZoneInfo
-) -> datetime:
-    _validate_hour(hour)
-    _validate_minute(minute)
-    return datetime(
-        year=target_date.year,
-        month=target_date.month,
-        day=target_date.day,
-        hour=hour,
-        minute=minute,
-        tzinfo=tz,
+@functools.lru_cache(maxsize=32)
+def _schedule_offsets(cfg: DailyScheduleConfig) -> tuple[timedelta, ...]:
+    """Validate ``cfg`` once and return each run's offset from the start anchor.
+
+    Anchors are wall-clock times on the target date, so the offsets do not
+    depend on the date and only the start anchor is built per day.
+    """
+
+    _validate_hour(cfg.start_hour)
+    _validate_minute(cfg.start_minute)
+    if cfg.run_count <= 0:
+        raise ValueError("run_count must be greater than 0")
+
+    if cfg.run_count == 1:
+        return (timedelta(0),)
+
+    _validate_hour(cfg.end_hour)
+    _validate_minute(cfg.end_minute)
+    interval = timedelta(
+        hours=cfg.end_hour - cfg.start_hour, minutes=cfg.end_minute - cfg.start_minute
     )
+    if interval < timedelta(0):
+        raise ValueError("end_hour must be greater than or equal to start_hour")
+
+    # ``timedelta * int / int`` is exact integer arithmetic rounded once to the
+    # microsecond, so no float step is accumulated and the last offset is
+    # exactly ``interval``.
+    intervals = cfg.run_count - 1
+    return tuple(interval * i / intervals for i in range(cfg.run_count))
 
 
 def generate_daily_schedule(
@@ -81,36 +100,49 @@ def generate_daily_schedule(
     anchors (hour and minute precision).
     """
 
-    cfg = config or DailyScheduleConfig()
-    tz = _coerce_timezone(cfg.timezone)
-    start_dt = _build_anchor_datetime(
-        target_date, cfg.start_hour, cfg.start_minute, tz
+    return list(_daily_schedule_cached(target_date, config or DailyScheduleConfig()))
+
+
+@functools.lru_cache(maxsize=256)
+def _daily_schedule_cached(
+    target_date: date, cfg: DailyScheduleConfig
+) -> tuple[datetime, ...]:
+    # Rolling look-ahead windows regenerate the same days over and over; the
+    # config is frozen and hashable, so each (date, config) is built once.
+    offsets = _schedule_offsets(cfg)
+    start_dt = datetime(
+        target_date.year,
+        target_date.month,
+        target_date.day,
+        cfg.start_hour,
+        cfg.start_minute,
+        tzinfo=_coerce_timezone(cfg.timezone),
     )
-    if cfg.run_count <= 0:
-        raise ValueError("run_count must be greater than 0")
+    # ``map`` over the offsets tuple sizes the result up front and avoids a
+    # generator frame per run.
+    return tuple(map(start_dt.__add__, offsets))
 
-    if cfg.run_count == 1:
-        return [start_dt]
 
-    end_dt = _build_anchor_datetime(
-        target_date, cfg.end_hour, cfg.end_minute, tz
-    )
-    if end_dt < start_dt:
-        raise ValueError("end_hour must be greater than or equal to start_hour")
-
-    interval_seconds = (end_dt - start_dt).total_seconds()
-    if cfg.run_count == 2:
-        return [start_dt, end_dt]
+def generate_daily_schedule_slots(
+    target_date: date,
+    config: DailyScheduleConfig | None = None,
+    timezone: ZoneInfo | str | None = None,
+) -> list[tuple[int, int, int]]:
+    """Return unique ``(hour, minute, second)`` slots for ``target_date``.
 
-    step = interval_seconds / (cfg.run_count - 1)
-    schedule: list[datetime] = []
-    for i in range(cfg.run_count):
-        delta = timedelta(seconds=step * i)
-        schedule.append(start_dt + delta)
+    Run times are expressed in ``timezone`` (defaulting to the schedule's own
+    timezone) and duplicates are dropped while preserving order, which makes
+    the result suitable for registering cron style jobs.
+    """
 
-    # ensure final anchor is exactly aligned even with floating point rounding
-    schedule[-1] = end_dt
-    return schedule
+    cfg = config or DailyScheduleConfig()
+    tz = _coerce_timezone(timezone or cfg.timezone)
+    slots: dict[tuple[int, int, int], None] = {}
+    for run in generate_daily_schedule(target_date, cfg):
+        if run.tzinfo is not tz:
+            run = run.astimezone(tz)
+        slots[(run.hour, run.minute, run.second)] = None
+    return list(slots)
 
 
 def _zoneinfo_from_datetime(dt: datetime) -> ZoneInfo | None:
@@ -122,16 +154,42 @@ def _zoneinfo_from_datetime(dt: datetime) -> ZoneInfo | None:
     tz_name = tzinfo.tzname(dt)
     if tz_name:
         try:
-            return ZoneInfo(tz_name)
-        except ZoneInfoNotFoundError:
+            return _cached_zoneinfo(tz_name)
+        except (ZoneInfoNotFoundError, ValueError):
             return None
     return None
 
 
+def _schedule_timezone(schedule: Iterable[datetime]) -> ZoneInfo | None:
+    for candidate in schedule:
+        candidate_tz = _zoneinfo_from_datetime(candidate)
+        if candidate_tz is not None:
+            return candidate_tz
+    return None
+
+
+def prepare_schedule(
+    schedule: Iterable[datetime], timezone: ZoneInfo | str | None = None
+) -> tuple[datetime, ...]:
+    """Return ``schedule`` converted to a single timezone and sorted.
+
+    The timezone is ``timezone`` when given, otherwise the first zone found on
+    the entries, falling back to the project default; naive entries are
+    interpreted in it. Pass the result to :func:`find_next_run_datetime` with
+    ``assume_sorted=True`` to poll the same schedule without re-sorting it.
+    """
+
+    entries = tuple(schedule)
+    tz = _coerce_timezone(timezone if timezone is not None else _schedule_timezone(entries))
+    return tuple(sorted(_localize_datetime(entry, tz) for entry in entries))
+
+
 def find_next_run_datetime(
     now: datetime,
     schedule: Sequence[datetime],
-    timezone: ZoneInfo | None = None,
+    timezone: ZoneInfo | str | None = None,
+    *,
+    assume_sorted: bool = False,
 ) -> datetime | None:
     """Return the next scheduled execution time at or after ``now``.
 
@@ -146,6 +204,12 @@ def find_next_run_datetime(
     timezone:
         Optional override timezone applied when neither ``schedule`` entries
         nor ``now`` provide one. Defaults to the project standard timezone.
+    assume_sorted:
+        When true, ``schedule`` must already be in chronological order (as
+        returned by :func:`generate_upcoming_run_times` or
+        :func:`prepare_schedule`) and the next run is located by binary search,
+        converting only the entries it probes. Timezone conversion preserves
+        the order of aware entries, so mixed zones are fine.
     """
 
     if not schedule:
@@ -153,38 +217,32 @@ def find_next_run_datetime(
 
     tz_candidate = timezone
     if tz_candidate is None:
-        for candidate in schedule:
-            candidate_tz = _zoneinfo_from_datetime(candidate)
-            if candidate_tz is not None:
-                tz_candidate = candidate_tz
-                break
+        tz_candidate = _schedule_timezone(schedule)
     if tz_candidate is None:
         tz_candidate = _zoneinfo_from_datetime(now)
     tz = _coerce_timezone(tz_candidate)
 
-    if now.tzinfo is None:
-        localized_now = now.replace(tzinfo=tz)
-    else:
-        localized_now = now.astimezone(tz)
+    localized_now = _localize_datetime(now, tz)
 
-    def _normalize(entries: Iterable[datetime]) -> list[datetime]:
-        normalized: list[datetime] = []
-        for entry in entries:
-            if entry.tzinfo is None:
-                normalized.append(entry.replace(tzinfo=tz))
-            else:
-                normalized.append(entry.astimezone(tz))
-        return normalized
+    def _normalize(entry: datetime) -> datetime:
+        return _localize_datetime(entry, tz)
 
-    normalized_schedule = sorted(_normalize(schedule))
+    if assume_sorted:
+        index = bisect_left(schedule, localized_now, key=_normalize)
+        return _normalize(schedule[index]) if index < len(schedule) else None
 
-    for run in normalized_schedule:
-        if run >= localized_now:
-            return run
+    # Schedules from ``generate_daily_schedule`` already carry the resolved
+    # zone instance, in which case no entry needs converting.
+    if all(entry.tzinfo is tz for entry in schedule):
+        runs: Iterable[datetime] = schedule
+    else:
+        runs = map(_normalize, schedule)
 
-    return None
+    # Only the earliest upcoming entry is needed, so a single pass replaces
+    # sorting the whole schedule.
+    return min((run for run in runs if run >= localized_now), default=None)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DailyScheduleWindow:
     """Upcoming executions for a given date."""
 
@@ -196,19 +254,32 @@ def _resolve_schedule_context(
     now: datetime, config: DailyScheduleConfig | None
 ) -> tuple[ZoneInfo, DailyScheduleConfig, datetime]:
     cfg = config or DailyScheduleConfig()
-    tz_candidate: ZoneInfo | None = cfg.timezone
+    tz_candidate: ZoneInfo | str | None = cfg.timezone
     if tz_candidate is None:
         tz_candidate = _zoneinfo_from_datetime(now)
     tz = _coerce_timezone(tz_candidate)
 
     effective_cfg = cfg if cfg.timezone is not None else replace(cfg, timezone=tz)
 
-    if now.tzinfo is None:
-        localized_now = now.replace(tzinfo=tz)
-    else:
-        localized_now = now.astimezone(tz)
+    return tz, effective_cfg, _localize_datetime(now, tz)
+
 
-    return tz, effective_cfg, localized_now
+def _iter_upcoming_schedules(
+    now: datetime, days: int, config: DailyScheduleConfig | None
+) -> Iterator[tuple[date, Sequence[datetime]]]:
+    if days <= 0:
+        raise ValueError("days must be greater than 0")
+
+    _tz, effective_cfg, localized_now = _resolve_schedule_context(now, config)
+
+    current_date = localized_now.date()
+    # Daily schedules are in ascending order, so the runs still ahead of
+    # ``now`` are a suffix found by binary search; slicing keeps it a tuple.
+    first_schedule = _daily_schedule_cached(current_date, effective_cfg)
+    yield current_date, first_schedule[bisect_left(first_schedule, localized_now):]
+    for offset in range(1, days):
+        target_date = current_date + timedelta(days=offset)
+        yield target_date, _daily_schedule_cached(target_date, effective_cfg)
 
 
 def generate_upcoming_run_windows(
@@ -222,23 +293,27 @@ def generate_upcoming_run_windows(
     windows include the full schedule for their date.
     """
 
-    if days <= 0:
-        raise ValueError("days must be greater than 0")
+    return [
+        DailyScheduleWindow(date=target_date, run_times=tuple(runs))
+        for target_date, runs in _iter_upcoming_schedules(now, days, config)
+    ]
 
-    _tz, effective_cfg, localized_now = _resolve_schedule_context(now, config)
 
-    windows: list[DailyScheduleWindow] = []
-    current_date = localized_now.date()
-    for offset in range(days):
-        target_date = current_date + timedelta(days=offset)
-        daily_schedule = generate_daily_schedule(target_date, effective_cfg)
-        if offset == 0:
-            runs = tuple(run for run in daily_schedule if run >= localized_now)
-        else:
-            runs = tuple(daily_schedule)
-        windows.append(DailyScheduleWindow(date=target_date, run_times=runs))
+def iter_upcoming_run_times(
+    now: datetime,
+    days: int,
+    config: DailyScheduleConfig | None = None,
+) -> Iterator[datetime]:
+    """Yield scheduled executions from ``now`` across ``days`` days.
+
+    Runs are produced in chronological order and each day's schedule is only
+    looked up once the previous day is exhausted, so taking the next run or
+    two does not build the whole look-ahead.
+    """
 
-    return windows
+    return chain.from_iterable(
+        runs for _target_date, runs in _iter_upcoming_schedules(now, days, config)
+    )
 
 
 def generate_upcoming_run_times(
@@ -246,20 +321,24 @@ def generate_upcoming_run_times(
     days: int,
     config: DailyScheduleConfig | None = None,
 ) -> list[datetime]:
-    """Return scheduled executions from ``now`` across ``days`` days."""
+    """Return scheduled executions from ``now`` across ``days`` days.
+
+    The result is in chronological order and shares one timezone, so it can be
+    passed to :func:`find_next_run_datetime` with ``assume_sorted=True``. Use
+    :func:`iter_upcoming_run_times` when only the first few runs are needed.
+    """
 
-    windows = generate_upcoming_run_windows(now, days, config)
-    upcoming: list[datetime] = []
-    for window in windows:
-        upcoming.extend(window.run_times)
-    return upcoming
+    return list(iter_upcoming_run_times(now, days, config))
 
 
 __all__ = [
     "DailyScheduleConfig",
     "DailyScheduleWindow",
     "generate_daily_schedule",
+    "generate_daily_schedule_slots",
     "find_next_run_datetime",
+    "prepare_schedule",
     "generate_upcoming_run_windows",
     "generate_upcoming_run_times",
+    "iter_upcoming_run_times",
 ]
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
+import functools
 import re
 from typing import Iterable, Mapping
 
@@ -32,30 +33,53 @@ def _to_micros(amount: float) -> int:
     return int(round(amount * 1_000_000))
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_query_dates(query: str) -> tuple[date, date]:
+    # The client reuses cached query strings, so each distinct range is parsed
+    # once instead of re-running the regex and ``fromisoformat`` per search.
+    match = _DATE_RANGE_RE.search(query)
+    if not match:
+        raise ConfigError(
+            "Demo transport received an unsupported query. "
+            "Expected a GAQL date BETWEEN clause."
+        )
+    return date.fromisoformat(match.group(1)), date.fromisoformat(match.group(2))
+
+
+def _demo_row(day: date, cost_micros: str) -> dict:
+    return {"segments": {"date": day.isoformat()}, "metrics": {"cost_micros": cost_micros}}
+
+
 @dataclass(frozen=True)
 class DemoTransport:
     """Simple transport that returns fixed spend totals."""
 
     daily_cost_micros: int
     month_to_date_cost_micros: int
+    # Response values are fixed per transport, so they are formatted once.
+    _daily_text: str = field(init=False, repr=False, compare=False)
+    _earlier_days_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_daily_text", str(self.daily_cost_micros))
+        object.__setattr__(
+            self,
+            "_earlier_days_text",
+            str(self.month_to_date_cost_micros - self.daily_cost_micros),
+        )
 
     def search(self, customer_id: str, query: str) -> Iterable[dict]:
-        match = _DATE_RANGE_RE.search(query)
-        if not match:
-            raise ConfigError(
-                "Demo transport received an unsupported query. "
-                "Expected a GAQL date BETWEEN clause."
-            )
-
-        start = date.fromisoformat(match.group(1))
-        end = date.fromisoformat(match.group(2))
+        start, end = _parse_query_dates(query)
 
         if start == end:
-            total = self.daily_cost_micros
-        else:
-            total = self.month_to_date_cost_micros
-
-        return [{"metrics": {"cost_micros": str(total)}}]
+            return [_demo_row(end, self._daily_text)]
+
+        # Split the month-to-date total so the last day carries the daily cost,
+        # which lets callers derive both figures from one query.
+        return [
+            _demo_row(start, self._earlier_days_text),
+            _demo_row(end, self._daily_text),
+        ]
 
 
 def build_transport(
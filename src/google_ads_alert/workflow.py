@@ -47,14 +47,20 @@ def build_forecast_snapshot(
     as_of: datetime | None = None,
     daily_budget: float | None = None,
     monthly_budget: float | None = None,
-    timezone_override: ZoneInfo | None = None,
+    timezone_override: ZoneInfo | str | None = None,
 ) -> ForecastSnapshot:
     """Create a consolidated forecast snapshot using ``cost_service`` data."""
 
     reference = as_of or datetime.now(timezone.utc)
 
-    daily_summary = cost_service.fetch_daily_cost(reference)
-    month_summary = cost_service.fetch_month_to_date_cost(reference)
+    # Prefer the single-request fetch; services that only implement the two
+    # separate methods keep working.
+    fetch_costs = getattr(cost_service, "fetch_costs", None)
+    if fetch_costs is not None:
+        daily_summary, month_summary = fetch_costs(reference)
+    else:
+        daily_summary = cost_service.fetch_daily_cost(reference)
+        month_summary = cost_service.fetch_month_to_date_cost(reference)
 
     tz_candidate = timezone_override
     if tz_candidate is None:
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import json
+import os
+import sys
+import urllib.error
 from datetime import date, datetime, timedelta
+from types import MappingProxyType
 
 import pytest
 from zoneinfo import ZoneInfo
@@ -14,6 +18,9 @@ from google_ads_alert.cli import (
     SchedulePreview,
     SchedulePreviewWindow,
     SchedulerSetupError,
+    _build_slack_sender,
+    _encode_slack_payload,
+    _import_factory,
     build_argument_parser,
     generate_schedule_preview,
     main,
@@ -36,14 +43,76 @@ from google_ads_alert.metrics import MetricsLoadError
 from google_ads_alert.workflow import ForecastSnapshot
 
 
-MIN_ENV = {
-    "GOOGLE_ADS_DEVELOPER_TOKEN": "dev-token",
-    "GOOGLE_ADS_CLIENT_ID": "client-id",
-    "GOOGLE_ADS_CLIENT_SECRET": "secret",
-    "GOOGLE_ADS_REFRESH_TOKEN": "refresh-token",
-    "GOOGLE_ADS_CUSTOMER_ID": "123-456-7890",
-    "SLACK_WEBHOOK_URL": "https://hooks.slack.com/services/T000/B000/XXXX",
-}
+UTC = ZoneInfo("UTC")
+TOKYO = ZoneInfo("Asia/Tokyo")
+
+# Read-only so no test can leak changes into the others. ``load_config`` is
+# memoised on the env values, so repeated loads of it are already cache hits.
+MIN_ENV = MappingProxyType(
+    {
+        "GOOGLE_ADS_DEVELOPER_TOKEN": "dev-token",
+        "GOOGLE_ADS_CLIENT_ID": "client-id",
+        "GOOGLE_ADS_CLIENT_SECRET": "secret",
+        "GOOGLE_ADS_REFRESH_TOKEN": "refresh-token",
+        "GOOGLE_ADS_CUSTOMER_ID": "123-456-7890",
+        "SLACK_WEBHOOK_URL": "https://hooks.slack.com/services/T000/B000/XXXX",
+    }
+)
+UTC_ENV = MappingProxyType({**MIN_ENV, "ALERT_TIMEZONE": "UTC"})
+UTC_CONFIG = load_config(UTC_ENV)
+
+
+def _make_daily_cost(as_of: datetime, micros: int) -> DailyCostSummary:
+    midnight = as_of.replace(hour=0, minute=0, second=0, microsecond=0)
+    return DailyCostSummary(
+        as_of=as_of,
+        report_start=midnight,
+        report_end=midnight + timedelta(days=1),
+        total_cost_micros=micros,
+    )
+
+
+def _make_mtd_cost(as_of: datetime, micros: int) -> MonthToDateCostSummary:
+    midnight = as_of.replace(hour=0, minute=0, second=0, microsecond=0)
+    return MonthToDateCostSummary(
+        as_of=as_of,
+        report_start=midnight.replace(day=1),
+        report_end=midnight + timedelta(days=1),
+        total_cost_micros=micros,
+    )
+
+
+class _FixedCostService:
+    """Stand-in for ``GoogleAdsCostService`` returning fixed cost totals."""
+
+    daily_micros = 0
+    mtd_micros = 0
+
+    def __init__(self, config, transport):
+        self._config = config
+        self._transport = transport
+
+    def fetch_daily_cost(self, reference):
+        return _make_daily_cost(reference, self.daily_micros)
+
+    def fetch_month_to_date_cost(self, reference):
+        return _make_mtd_cost(reference, self.mtd_micros)
+
+
+def _patch_cost_service(monkeypatch, *, daily_micros: int, mtd_micros: int) -> None:
+    service = type(
+        "FixedCostService",
+        (_FixedCostService,),
+        {"daily_micros": daily_micros, "mtd_micros": mtd_micros},
+    )
+    monkeypatch.setattr("google_ads_alert.cli.GoogleAdsCostService", service)
+
+
+_TRANSPORT_SENTINEL = object()
+
+
+def _noop_transport_factory(config, env_values):
+    return _TRANSPORT_SENTINEL
 
 
 def test_run_doctor_successful() -> None:
@@ -68,6 +137,24 @@ def test_run_doctor_flags_invalid_schedule() -> None:
     assert any(check.name == "schedule.generate" and not check.passed for check in report.checks)
 
 
+@pytest.mark.parametrize(
+    ("webhook_url", "passed", "fragment"),
+    [
+        ("https://hooks.slack.com/services/T000/B000/XXXX", True, "appears valid."),
+        ("https://example.com/hook", True, "non-standard endpoint"),
+        ("https://hooks.slack.com.attacker.net/services/T000", True, "non-standard endpoint"),
+        ("https://hooks.slack.company/services/T000", True, "non-standard endpoint"),
+        ("http://hooks.slack.com/services/T000/B000/XXXX", False, "must start with"),
+    ],
+)
+def test_run_doctor_checks_slack_webhook(webhook_url: str, passed: bool, fragment: str) -> None:
+    report = run_doctor(base_env={**MIN_ENV, "SLACK_WEBHOOK_URL": webhook_url})
+
+    check = next(check for check in report.checks if check.name == "slack.webhook")
+    assert check.passed is passed
+    assert fragment in check.details
+
+
 def test_render_report_includes_failures() -> None:
     report = DoctorReport(
         checks=(
@@ -101,18 +188,42 @@ def test_main_returns_exit_code(monkeypatch, capsys) -> None:
     assert "Doctor summary" in output
 
 
-def test_main_propagates_failure(monkeypatch, capsys) -> None:
-    def fake_run_doctor(env_path=None, *, base_env=None):
-        return DoctorReport(
-            checks=(DoctorCheck(name="bad", passed=False, details="oops"),)
-        )
+@pytest.mark.parametrize(
+    ("argv", "target", "outcome", "stream", "needle"),
+    [
+        (
+            ["doctor"],
+            "run_doctor",
+            DoctorReport(checks=(DoctorCheck(name="bad", passed=False, details="oops"),)),
+            "out",
+            "FAIL",
+        ),
+        (["run"], "run_once", RunError("failed"), "err", "failed"),
+        (["schedule"], "run_schedule_preview", ConfigError("boom"), "err", "boom"),
+        (
+            ["metrics", "history.jsonl"],
+            "load_alert_run_records_from_jsonl",
+            MetricsLoadError("bad data"),
+            "err",
+            "Failed to load metrics",
+        ),
+    ],
+    ids=["doctor", "run", "schedule", "metrics"],
+)
+def test_main_reports_failures(
+    monkeypatch, capsys, argv, target, outcome, stream, needle
+) -> None:
+    def fake_entrypoint(*args, **kwargs):
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
 
-    monkeypatch.setattr("google_ads_alert.cli.run_doctor", fake_run_doctor)
+    monkeypatch.setattr(f"google_ads_alert.cli.{target}", fake_entrypoint)
 
-    exit_code = main(["doctor"])
+    exit_code = main(argv)
 
     assert exit_code == 1
-    assert "FAIL" in capsys.readouterr().out
+    assert needle in getattr(capsys.readouterr(), stream)
 
 
 def test_build_argument_parser_sets_prog() -> None:
@@ -120,30 +231,55 @@ def test_build_argument_parser_sets_prog() -> None:
     assert parser.prog == "google_ads_alert"
 
 
+def test_main_reuses_cached_argument_parser() -> None:
+    parser = build_argument_parser()
+
+    main(["metrics", "history.jsonl", "--start", "invalid"])
+
+    assert build_argument_parser() is parser
+
+
 def test_generate_schedule_preview_returns_windows() -> None:
-    env = {**MIN_ENV, "ALERT_TIMEZONE": "UTC"}
-    config = load_config(env)
-    reference = datetime(2024, 1, 1, 7, 0, tzinfo=ZoneInfo("UTC"))
+    reference = datetime(2024, 1, 1, 7, 0, tzinfo=UTC)
 
-    preview = generate_schedule_preview(config, days=2, reference_time=reference)
+    preview = generate_schedule_preview(UTC_CONFIG, days=2, reference_time=reference)
 
-    assert preview.generated_at.tzinfo == ZoneInfo("UTC")
+    assert preview.generated_at.tzinfo == UTC
     assert len(preview.windows) == 2
-    assert all(run.tzinfo == ZoneInfo("UTC") for run in preview.windows[0].run_times)
+    assert all(run.tzinfo == UTC for run in preview.windows[0].run_times)
 
 
 def test_run_schedule_preview_uses_base_env() -> None:
     env = {**MIN_ENV, "ALERT_TIMEZONE": "UTC"}
-    reference = datetime(2024, 1, 1, 7, 0, tzinfo=ZoneInfo("UTC"))
+    reference = datetime(2024, 1, 1, 7, 0, tzinfo=UTC)
 
     preview = run_schedule_preview(None, base_env=env, days=1, reference_time=reference)
 
     assert preview.windows
 
 
+def test_run_schedule_preview_reloads_changed_env_file(tmp_path) -> None:
+    env_file = tmp_path / "alert.env"
+    env_file.write_text("ALERT_TIMEZONE=UTC\nALERT_RUN_COUNT=1\n", encoding="utf-8")
+    reference = datetime(2024, 1, 1, 7, 0, tzinfo=UTC)
+
+    first = run_schedule_preview(env_file, base_env=MIN_ENV, days=1, reference_time=reference)
+    cached = run_schedule_preview(env_file, base_env=MIN_ENV, days=1, reference_time=reference)
+
+    old_mtime_ns = env_file.stat().st_mtime_ns
+    env_file.write_text("ALERT_TIMEZONE=UTC\nALERT_RUN_COUNT=3\n", encoding="utf-8")
+    # Step the mtime explicitly so the edit is visible on coarse-timestamp hosts.
+    os.utime(env_file, ns=(old_mtime_ns, old_mtime_ns + 1_000_000_000))
+    reloaded = run_schedule_preview(env_file, base_env=MIN_ENV, days=1, reference_time=reference)
+
+    assert len(first.windows[0].run_times) == 1
+    assert cached == first
+    assert len(reloaded.windows[0].run_times) == 3
+
+
 def test_render_schedule_preview_formats_output() -> None:
     preview = SchedulePreview(
-        generated_at=datetime(2024, 1, 1, 7, 0, tzinfo=ZoneInfo("UTC")),
+        generated_at=datetime(2024, 1, 1, 7, 0, tzinfo=UTC),
         windows=(
             SchedulePreviewWindow(date=date(2024, 1, 1), run_times=()),
         ),
@@ -161,11 +297,11 @@ def test_main_schedule_command(monkeypatch, capsys) -> None:
         captured["env_path"] = env_path
         captured["days"] = days
         return SchedulePreview(
-            generated_at=datetime(2024, 1, 1, tzinfo=ZoneInfo("UTC")),
+            generated_at=datetime(2024, 1, 1, tzinfo=UTC),
             windows=(
                 SchedulePreviewWindow(
                     date=date(2024, 1, 1),
-                    run_times=(datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo("UTC")),),
+                    run_times=(datetime(2024, 1, 1, 8, 0, tzinfo=UTC),),
                 ),
             ),
         )
@@ -182,18 +318,6 @@ def test_main_schedule_command(monkeypatch, capsys) -> None:
     assert "Schedule preview" in output
 
 
-def test_main_schedule_reports_errors(monkeypatch, capsys) -> None:
-    def fake_run_schedule(env_path=None, *, days, base_env=None, reference_time=None):
-        raise ConfigError("boom")
-
-    monkeypatch.setattr("google_ads_alert.cli.run_schedule_preview", fake_run_schedule)
-
-    exit_code = main(["schedule"])
-
-    assert exit_code == 1
-    assert "boom" in capsys.readouterr().err
-
-
 def test_run_once_dry_run(monkeypatch) -> None:
     env = {
         **MIN_ENV,
@@ -202,39 +326,15 @@ def test_run_once_dry_run(monkeypatch) -> None:
         "ALERT_TIMEZONE": "UTC",
     }
 
-    as_of = datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo("UTC"))
-
-    class DummyService:
-        def __init__(self, config, transport):
-            self._config = config
-            self._transport = transport
-
-        def fetch_daily_cost(self, reference):
-            return DailyCostSummary(
-                as_of=reference,
-                report_start=reference.replace(hour=0, minute=0, second=0, microsecond=0),
-                report_end=reference.replace(hour=0, minute=0, second=0, microsecond=0)
-                + timedelta(days=1),
-                total_cost_micros=12_345_000,
-            )
-
-        def fetch_month_to_date_cost(self, reference):
-            start = reference.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            end = reference.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
-            return MonthToDateCostSummary(
-                as_of=reference,
-                report_start=start,
-                report_end=end,
-                total_cost_micros=67_890_000,
-            )
-
-    monkeypatch.setattr("google_ads_alert.cli.GoogleAdsCostService", DummyService)
+    as_of = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+
+    _patch_cost_service(monkeypatch, daily_micros=12_345_000, mtd_micros=67_890_000)
 
     result = run_once(
         None,
         base_env=env,
         dry_run=True,
-        transport_factory=lambda config, env_values: object(),
+        transport_factory=_noop_transport_factory,
         reference_time=as_of,
     )
 
@@ -244,6 +344,31 @@ def test_run_once_dry_run(monkeypatch) -> None:
     assert result.payload["blocks"]
 
 
+def test_run_once_hands_factories_a_read_only_environment(monkeypatch) -> None:
+    env = {**MIN_ENV, "ALERT_TIMEZONE": "UTC"}
+    seen: list = []
+
+    def _capturing_transport_factory(config, env_values):
+        seen.append(env_values)
+        return _TRANSPORT_SENTINEL
+
+    _patch_cost_service(monkeypatch, daily_micros=1_000_000, mtd_micros=2_000_000)
+
+    run_once(
+        None,
+        base_env=env,
+        dry_run=True,
+        transport_factory=_capturing_transport_factory,
+        reference_time=datetime(2024, 1, 1, 12, 0, tzinfo=UTC),
+    )
+
+    (env_values,) = seen
+    assert env_values["ALERT_TIMEZONE"] == "UTC"
+    with pytest.raises(TypeError):
+        env_values["ALERT_TIMEZONE"] = "Asia/Tokyo"
+    assert env["ALERT_TIMEZONE"] == "UTC"
+
+
 def test_run_once_with_demo_transport() -> None:
     env = {
         **MIN_ENV,
@@ -256,7 +381,7 @@ def test_run_once_with_demo_transport() -> None:
         "MONTHLY_BUDGET": "5000000",
     }
 
-    reference = datetime(2024, 6, 15, 12, 0, tzinfo=ZoneInfo("Asia/Tokyo"))
+    reference = datetime(2024, 6, 15, 12, 0, tzinfo=TOKYO)
 
     result = run_once(
         None,
@@ -273,70 +398,129 @@ def test_run_once_with_demo_transport() -> None:
     assert result.payload["blocks"]
 
 
-def test_render_run_result_outputs_payload(monkeypatch) -> None:
-    env = {
-        **MIN_ENV,
-        "DAILY_BUDGET": "100000",
-        "MONTHLY_BUDGET": "3000000",
-    }
-    as_of = datetime(2024, 5, 1, 9, 30, tzinfo=ZoneInfo("UTC"))
-
-    class DummyService:
-        def __init__(self, config, transport):
-            self._config = config
-            self._transport = transport
-
-        def fetch_daily_cost(self, reference):
-            return DailyCostSummary(
-                as_of=reference,
-                report_start=reference.replace(hour=0, minute=0, second=0, microsecond=0),
-                report_end=reference.replace(hour=0, minute=0, second=0, microsecond=0)
-                + timedelta(days=1),
-                total_cost_micros=5_000_000_000,
-            )
-
-        def fetch_month_to_date_cost(self, reference):
-            start = reference.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            end = reference.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
-            return MonthToDateCostSummary(
-                as_of=reference,
-                report_start=start,
-                report_end=end,
-                total_cost_micros=25_000_000_000,
-            )
-
-    monkeypatch.setattr("google_ads_alert.cli.GoogleAdsCostService", DummyService)
+def test_import_factory_caches_resolved_factories() -> None:
+    _import_factory.cache_clear()
+    spec = "google_ads_alert.transports.demo"
 
-    result = run_once(
-        None,
-        base_env=env,
+    first = _import_factory(spec, default_attr="build_transport")
+    second = _import_factory(spec, default_attr="build_transport")
+
+    assert first is second
+    assert _import_factory.cache_info().hits == 1
+
+    with pytest.raises(ConfigError):
+        _import_factory(spec, default_attr="missing_factory")
+
+
+class _FakeWebhookResponse:
+    def __init__(self, status: int = 200) -> None:
+        self.status = status
+        self.closed = False
+
+    def __enter__(self) -> "_FakeWebhookResponse":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.closed = True
+
+
+def _patch_urlopen(monkeypatch, *responses: _FakeWebhookResponse) -> list[object]:
+    requests: list[object] = []
+    pending = list(responses)
+
+    def fake_urlopen(request, timeout=None):
+        requests.append(request)
+        return pending.pop(0)
+
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    return requests
+
+
+def test_run_once_posts_each_alert_and_closes_the_response(monkeypatch) -> None:
+    responses = (_FakeWebhookResponse(), _FakeWebhookResponse())
+    requests = _patch_urlopen(monkeypatch, *responses)
+    _patch_cost_service(monkeypatch, daily_micros=1_000_000, mtd_micros=2_000_000)
+
+    for _ in range(2):
+        result = run_once(
+            None,
+            base_env=UTC_ENV,
+            transport_factory=_noop_transport_factory,
+            reference_time=datetime(2024, 1, 1, 12, 0, tzinfo=UTC),
+        )
+        assert result.delivered
+
+    assert [request.full_url for request in requests] == [MIN_ENV["SLACK_WEBHOOK_URL"]] * 2
+    assert all(request.get_method() == "POST" for request in requests)
+    assert json.loads(requests[0].data)["blocks"]
+    assert all(response.closed for response in responses)
+
+
+def test_slack_sender_raises_run_error_for_error_status(monkeypatch) -> None:
+    def fake_urlopen(request, timeout=None):
+        raise urllib.error.HTTPError(request.full_url, 404, "Not Found", None, None)
+
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+
+    with pytest.raises(RunError, match="404"):
+        _build_slack_sender(MIN_ENV["SLACK_WEBHOOK_URL"])({"text": "hello"})
+
+
+def test_slack_sender_rejects_non_success_status(monkeypatch) -> None:
+    _patch_urlopen(monkeypatch, _FakeWebhookResponse(204), _FakeWebhookResponse(302))
+    sender = _build_slack_sender(MIN_ENV["SLACK_WEBHOOK_URL"])
+
+    sender({"text": "hello"})
+    with pytest.raises(RunError, match="302"):
+        sender({"text": "hello"})
+
+
+def test_encode_slack_payload_fallback_matches_default_for_text_payloads(monkeypatch) -> None:
+    payload = {"text": "予算アラート", "blocks": [{"type": "header", "emoji": True}]}
+    encoded = _encode_slack_payload(payload)
+
+    monkeypatch.setattr("google_ads_alert.cli.orjson", None)
+
+    assert _encode_slack_payload(payload) == encoded
+    assert json.loads(encoded) == payload
+
+
+def test_encode_slack_payload_fallback_decodes_floats_to_the_same_values(monkeypatch) -> None:
+    payload = {"text": "pace", "ratio": 0.1, "spend": 1e16}
+    encoded = _encode_slack_payload(payload)
+
+    monkeypatch.setattr("google_ads_alert.cli.orjson", None)
+    fallback = _encode_slack_payload(payload)
+
+    # Only the decoded values are guaranteed to agree; float spellings differ.
+    assert json.loads(fallback) == json.loads(encoded) == payload
+
+
+def test_render_run_result_outputs_payload() -> None:
+    as_of = datetime(2024, 5, 1, 9, 30, tzinfo=UTC)
+    result = RunResult(
+        snapshot=_make_snapshot(
+            as_of, daily_micros=5_000_000_000, mtd_micros=25_000_000_000
+        ),
+        payload={"blocks": [{"type": "section"}]},
+        delivered=False,
         dry_run=True,
-        transport_factory=lambda config, env_values: object(),
-        reference_time=as_of,
     )
 
     text = render_run_result(result)
     assert "Run result" in text
     assert "Payload" in text
     assert "5,000.00" in text
+    assert "Month-to-date spend: 25,000.00" in text
 
 
-def test_main_run_command(monkeypatch, capsys) -> None:
-    as_of = datetime(2024, 1, 1, tzinfo=ZoneInfo("UTC"))
-    snapshot = ForecastSnapshot(
+def _make_snapshot(
+    as_of: datetime, *, daily_micros: int = 0, mtd_micros: int = 0
+) -> ForecastSnapshot:
+    return ForecastSnapshot(
         as_of=as_of,
-        daily_cost=DailyCostSummary(
-            as_of=as_of,
-            report_start=as_of - timedelta(days=1),
-            report_end=as_of + timedelta(days=1),
-            total_cost_micros=0,
-        ),
-        month_to_date_cost=MonthToDateCostSummary(
-            as_of=as_of,
-            report_start=as_of.replace(day=1),
-            report_end=as_of + timedelta(days=1),
-            total_cost_micros=0,
-        ),
+        daily_cost=_make_daily_cost(as_of, daily_micros),
+        month_to_date_cost=_make_mtd_cost(as_of, mtd_micros),
         forecast=CombinedForecastResult(
             daily=DailyForecastResult(
                 as_of=as_of,
@@ -363,8 +547,32 @@ def test_main_run_command(monkeypatch, capsys) -> None:
         ),
     )
 
+
+# Snapshots are frozen, so tests that only pass one through can share this.
+_ZERO_SNAPSHOT = _make_snapshot(datetime(2024, 1, 1, tzinfo=UTC))
+
+
+def test_render_run_result_summarizes_delivered_payload() -> None:
+    payload = {"blocks": [{"type": "section"}, {"type": "divider"}]}
+    result = RunResult(
+        snapshot=_ZERO_SNAPSHOT,
+        payload=payload,
+        delivered=True,
+        dry_run=False,
+    )
+
+    text = render_run_result(result)
+
+    assert "Delivery: sent to Slack" in text
+    assert text.endswith(
+        f"Payload: 2 block(s), {len(_encode_slack_payload(payload))} bytes"
+    )
+    assert '"type"' not in text
+
+
+def test_main_run_command(monkeypatch, capsys) -> None:
     sentinel = RunResult(
-        snapshot=snapshot,
+        snapshot=_ZERO_SNAPSHOT,
         payload={"ok": True},
         delivered=False,
         dry_run=True,
@@ -388,16 +596,23 @@ def test_main_run_command(monkeypatch, capsys) -> None:
     assert "rendered" in capsys.readouterr().out
 
 
-def test_main_run_reports_errors(monkeypatch, capsys) -> None:
-    def fake_run_once(env_path, **kwargs):
-        raise RunError("failed")
+class _StubScheduler:
+    def __init__(self) -> None:
+        self.jobs: list[dict[str, object]] = []
+        self.removed = False
+        self.started = False
 
-    monkeypatch.setattr("google_ads_alert.cli.run_once", fake_run_once)
+    def add_job(self, func, trigger, **kwargs):
+        self.jobs.append({"func": func, "trigger": trigger, **kwargs})
 
-    exit_code = main(["run"])
+    def start(self) -> None:
+        self.started = True
 
-    assert exit_code == 1
-    assert "failed" in capsys.readouterr().err
+    def remove_all_jobs(self) -> None:
+        self.removed = True
+
+    def shutdown(self, wait: bool = True) -> None:  # pragma: no cover - optional
+        self.started = False
 
 
 def test_run_scheduler_registers_cron_jobs(monkeypatch) -> None:
@@ -417,25 +632,7 @@ def test_run_scheduler_registers_cron_jobs(monkeypatch) -> None:
 
     monkeypatch.setattr("google_ads_alert.cli.run_once", fake_run_once)
 
-    class StubScheduler:
-        def __init__(self) -> None:
-            self.jobs: list[dict[str, object]] = []
-            self.removed = False
-
-        def add_job(self, func, trigger, **kwargs):
-            entry = {"func": func, "trigger": trigger, **kwargs}
-            self.jobs.append(entry)
-
-        def start(self) -> None:  # pragma: no cover - not used in this test
-            raise AssertionError("start should not be invoked")
-
-        def remove_all_jobs(self) -> None:
-            self.removed = True
-
-        def shutdown(self, wait: bool = True) -> None:  # pragma: no cover - optional
-            pass
-
-    stub = StubScheduler()
+    stub = _StubScheduler()
 
     scheduler = run_scheduler(
         None,
@@ -446,12 +643,13 @@ def test_run_scheduler_registers_cron_jobs(monkeypatch) -> None:
 
     assert scheduler is stub
     assert stub.removed
+    assert not stub.started
     assert len(stub.jobs) == 2
     assert all(job["trigger"] == "cron" for job in stub.jobs)
     assert {job["hour"] for job in stub.jobs} == {8, 12}
     assert all(job["minute"] == 0 for job in stub.jobs)
     assert all(job["second"] == 0 for job in stub.jobs)
-    assert all(job["timezone"] == ZoneInfo("UTC") for job in stub.jobs)
+    assert all(job["timezone"] == UTC for job in stub.jobs)
 
     # Execute the first scheduled job and ensure run_once receives the expected arguments.
     stub.jobs[0]["func"]()
@@ -463,25 +661,16 @@ def test_run_scheduler_registers_cron_jobs(monkeypatch) -> None:
     assert "GOOGLE_ADS_CLIENT_ID" in call["base_env"]
 
 
-def test_run_scheduler_requires_apscheduler_when_missing() -> None:
-    env = dict(MIN_ENV)
+def test_run_scheduler_requires_apscheduler_when_missing(monkeypatch) -> None:
+    # A ``None`` entry makes the import fail even where APScheduler is installed.
+    monkeypatch.setitem(sys.modules, "apscheduler", None)
 
-    with pytest.raises(SchedulerSetupError):
-        run_scheduler(None, base_env=env)
+    with pytest.raises(SchedulerSetupError, match="APScheduler is required"):
+        run_scheduler(None, base_env=MIN_ENV)
 
 
 def test_main_serve_uses_scheduler(monkeypatch, capsys) -> None:
-    class StubScheduler:
-        def __init__(self) -> None:
-            self.started = False
-
-        def start(self) -> None:
-            self.started = True
-
-        def shutdown(self, wait: bool = True) -> None:  # pragma: no cover - optional
-            self.started = False
-
-    stub = StubScheduler()
+    stub = _StubScheduler()
 
     def fake_run_scheduler(env_path, **kwargs):
         assert kwargs["dry_run"] is True
@@ -497,30 +686,28 @@ def test_main_serve_uses_scheduler(monkeypatch, capsys) -> None:
     assert "Scheduler started" in output
 
 
+def _write_history(path, records: list[dict[str, object]]) -> None:
+    path.write_bytes(b"\n".join(json.dumps(record).encode() for record in records))
+
+
+_FRESH_SUCCESS = MappingProxyType(
+    {"status": "success", "forecast_success": True, "data_fresh": True}
+)
+
+
 def test_main_metrics_command(tmp_path, capsys) -> None:
     history = tmp_path / "history.jsonl"
-    history.write_text(
-        "\n".join(
-            [
-                json.dumps(
-                    {
-                        "scheduled_for": "2024-05-01T08:00:00+09:00",
-                        "status": "success",
-                        "forecast_success": True,
-                        "data_fresh": True,
-                    }
-                ),
-                json.dumps(
-                    {
-                        "scheduled_for": "2024-05-01T14:00:00+09:00",
-                        "status": "failure",
-                        "forecast_success": False,
-                        "data_fresh": False,
-                    }
-                ),
-            ]
-        ),
-        encoding="utf-8",
+    _write_history(
+        history,
+        [
+            {"scheduled_for": "2024-05-01T08:00:00+09:00", **_FRESH_SUCCESS},
+            {
+                "scheduled_for": "2024-05-01T14:00:00+09:00",
+                "status": "failure",
+                "forecast_success": False,
+                "data_fresh": False,
+            },
+        ],
     )
 
     exit_code = main(["metrics", str(history)])
@@ -533,28 +720,12 @@ def test_main_metrics_command(tmp_path, capsys) -> None:
 
 def test_main_metrics_command_supports_filters_and_json(tmp_path, capsys) -> None:
     history = tmp_path / "history.jsonl"
-    history.write_text(
-        "\n".join(
-            [
-                json.dumps(
-                    {
-                        "scheduled_for": "2024-05-01T08:00:00+09:00",
-                        "status": "success",
-                        "forecast_success": True,
-                        "data_fresh": True,
-                    }
-                ),
-                json.dumps(
-                    {
-                        "scheduled_for": "2024-05-01T14:00:00+09:00",
-                        "status": "success",
-                        "forecast_success": True,
-                        "data_fresh": True,
-                    }
-                ),
-            ]
-        ),
-        encoding="utf-8",
+    _write_history(
+        history,
+        [
+            {"scheduled_for": "2024-05-01T08:00:00+09:00", **_FRESH_SUCCESS},
+            {"scheduled_for": "2024-05-01T14:00:00+09:00", **_FRESH_SUCCESS},
+        ],
     )
 
     exit_code = main(
@@ -577,217 +748,71 @@ def test_main_metrics_command_supports_filters_and_json(tmp_path, capsys) -> Non
     assert payload["measurements"][0]["numerator"] == 1
 
 
-def test_main_metrics_command_supports_day_grouping(tmp_path, capsys) -> None:
-    history = tmp_path / "history.jsonl"
-    history.write_text(
-        "\n".join(
-            [
-                json.dumps(
-                    {
-                        "scheduled_for": "2024-05-01T08:00:00+09:00",
-                        "status": "success",
-                        "forecast_success": True,
-                        "data_fresh": True,
-                    }
-                ),
-                json.dumps(
-                    {
-                        "scheduled_for": "2024-05-02T08:00:00+09:00",
-                        "status": "success",
-                        "forecast_success": True,
-                        "data_fresh": True,
-                    }
-                ),
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    exit_code = main(
-        [
-            "metrics",
-            str(history),
-            "--group-by",
+@pytest.mark.parametrize(
+    ("group_by", "records", "needle"),
+    [
+        (
             "day",
-            "--timezone",
-            "Asia/Tokyo",
-        ]
-    )
-
-    assert exit_code == 0
-    captured = capsys.readouterr()
-    assert "grouped by day" in captured.out
-    assert "Date: 2024-05-02" in captured.out
-
-
-def test_main_metrics_command_supports_week_grouping(tmp_path, capsys) -> None:
-    history = tmp_path / "history.jsonl"
-    history.write_text(
-        "\n".join(
             [
-                json.dumps(
-                    {
-                        "scheduled_for": "2024-05-01T08:00:00+09:00",
-                        "status": "success",
-                        "forecast_success": True,
-                        "data_fresh": True,
-                    }
-                ),
-                json.dumps(
-                    {
-                        "scheduled_for": "2024-05-08T08:00:00+09:00",
-                        "status": "success",
-                        "forecast_success": True,
-                        "data_fresh": True,
-                    }
-                ),
-            ]
+                {"scheduled_for": "2024-05-01T08:00:00+09:00", **_FRESH_SUCCESS},
+                {"scheduled_for": "2024-05-02T08:00:00+09:00", **_FRESH_SUCCESS},
+            ],
+            "Date: 2024-05-02",
         ),
-        encoding="utf-8",
-    )
-
-    exit_code = main(
-        [
-            "metrics",
-            str(history),
-            "--group-by",
+        (
             "week",
-            "--timezone",
-            "Asia/Tokyo",
-        ]
-    )
-
-    assert exit_code == 0
-    captured = capsys.readouterr()
-    assert "grouped by week" in captured.out
-    assert "Week: 2024-W18" in captured.out
-
-
-def test_main_metrics_command_supports_month_grouping(tmp_path, capsys) -> None:
-    history = tmp_path / "history.jsonl"
-    history.write_text(
-        "\n".join(
             [
-                json.dumps(
-                    {
-                        "scheduled_for": "2024-04-30T23:00:00+00:00",
-                        "status": "success",
-                    }
-                ),
-                json.dumps(
-                    {
-                        "scheduled_for": "2024-05-01T08:00:00+09:00",
-                        "status": "failure",
-                    }
-                ),
-            ]
+                {"scheduled_for": "2024-05-01T08:00:00+09:00", **_FRESH_SUCCESS},
+                {"scheduled_for": "2024-05-08T08:00:00+09:00", **_FRESH_SUCCESS},
+            ],
+            "Week: 2024-W18",
         ),
-        encoding="utf-8",
-    )
-
-    exit_code = main(
-        [
-            "metrics",
-            str(history),
-            "--group-by",
+        (
             "month",
-            "--timezone",
-            "Asia/Tokyo",
-        ]
-    )
-
-    assert exit_code == 0
-    captured = capsys.readouterr()
-    assert "grouped by month" in captured.out
-    assert "Month: 2024-05" in captured.out
-
-
-def test_main_metrics_command_outputs_json_for_day_grouping(tmp_path, capsys) -> None:
-    history = tmp_path / "history.jsonl"
-    history.write_text(
-        json.dumps(
-            {
-                "scheduled_for": "2024-05-01T08:00:00+09:00",
-                "status": "success",
-                "forecast_success": True,
-                "data_fresh": True,
-            }
+            [
+                {"scheduled_for": "2024-04-30T23:00:00+00:00", "status": "success"},
+                {"scheduled_for": "2024-05-01T08:00:00+09:00", "status": "failure"},
+            ],
+            "Month: 2024-05",
         ),
-        encoding="utf-8",
-    )
-
-    exit_code = main(
-        [
-            "metrics",
-            str(history),
-            "--group-by",
-            "day",
-            "--timezone",
-            "Asia/Tokyo",
-            "--format",
-            "json",
-        ]
-    )
-
-    assert exit_code == 0
-    captured = capsys.readouterr()
-    payload = json.loads(captured.out)
-    assert payload["group_by"] == "day"
-    assert payload["groups"][0]["report"]["total_records"] == 1
-
-
-def test_main_metrics_command_outputs_json_for_week_grouping(tmp_path, capsys) -> None:
+    ],
+)
+def test_main_metrics_command_supports_grouping(
+    tmp_path, capsys, group_by: str, records: list[dict[str, object]], needle: str
+) -> None:
     history = tmp_path / "history.jsonl"
-    history.write_text(
-        json.dumps(
-            {
-                "scheduled_for": "2024-05-01T08:00:00+09:00",
-                "status": "success",
-                "forecast_success": True,
-                "data_fresh": True,
-            }
-        ),
-        encoding="utf-8",
-    )
+    _write_history(history, records)
 
     exit_code = main(
-        [
-            "metrics",
-            str(history),
-            "--group-by",
-            "week",
-            "--timezone",
-            "Asia/Tokyo",
-            "--format",
-            "json",
-        ]
+        ["metrics", str(history), "--group-by", group_by, "--timezone", "Asia/Tokyo"]
     )
 
     assert exit_code == 0
     captured = capsys.readouterr()
-    payload = json.loads(captured.out)
-    assert payload["group_by"] == "week"
-    assert payload["groups"][0]["report"]["total_records"] == 1
+    assert f"grouped by {group_by}" in captured.out
+    assert needle in captured.out
 
 
-def test_main_metrics_command_outputs_json_for_month_grouping(tmp_path, capsys) -> None:
+@pytest.mark.parametrize(
+    ("group_by", "record"),
+    [
+        ("day", {"scheduled_for": "2024-05-01T08:00:00+09:00", **_FRESH_SUCCESS}),
+        ("week", {"scheduled_for": "2024-05-01T08:00:00+09:00", **_FRESH_SUCCESS}),
+        ("month", {"scheduled_for": "2024-05-01T08:00:00+09:00", "status": "success"}),
+    ],
+)
+def test_main_metrics_command_outputs_json_for_grouping(
+    tmp_path, capsys, group_by: str, record: dict[str, object]
+) -> None:
     history = tmp_path / "history.jsonl"
-    history.write_text(
-        json.dumps(
-            {
-                "scheduled_for": "2024-05-01T08:00:00+09:00",
-                "status": "success",
-            }
-        ),
-        encoding="utf-8",
-    )
+    _write_history(history, [record])
 
     exit_code = main(
         [
             "metrics",
             str(history),
             "--group-by",
-            "month",
+            group_by,
             "--timezone",
             "Asia/Tokyo",
             "--format",
@@ -798,7 +823,7 @@ def test_main_metrics_command_outputs_json_for_month_grouping(tmp_path, capsys)
     assert exit_code == 0
     captured = capsys.readouterr()
     payload = json.loads(captured.out)
-    assert payload["group_by"] == "month"
+    assert payload["group_by"] == group_by
     assert payload["groups"][0]["report"]["total_records"] == 1
 
 
@@ -811,21 +836,12 @@ def test_main_metrics_command_reports_invalid_datetime(capsys) -> None:
     ])
 
     assert exit_code == 1
-    captured = capsys.readouterr()
-    assert "Invalid metrics option" in captured.err
+    assert "Invalid metrics option" in capsys.readouterr().err
 
 
 def test_main_metrics_command_reports_invalid_range(tmp_path, capsys) -> None:
     history = tmp_path / "history.jsonl"
-    history.write_text(
-        json.dumps(
-            {
-                "scheduled_for": "2024-05-01T08:00:00+09:00",
-                "status": "success",
-            }
-        ),
-        encoding="utf-8",
-    )
+    _write_history(history, [{"scheduled_for": "2024-05-01T08:00:00+09:00", "status": "success"}])
 
     exit_code = main(
         [
@@ -839,20 +855,4 @@ def test_main_metrics_command_reports_invalid_range(tmp_path, capsys) -> None:
     )
 
     assert exit_code == 1
-    captured = capsys.readouterr()
-    assert "Failed to compute metrics" in captured.err
-
-
-def test_main_metrics_reports_errors(monkeypatch, capsys) -> None:
-    def fake_loader(path):
-        raise MetricsLoadError("bad data")
-
-    monkeypatch.setattr(
-        "google_ads_alert.cli.load_alert_run_records_from_jsonl", fake_loader
-    )
-
-    exit_code = main(["metrics", "history.jsonl"])
-
-    assert exit_code == 1
-    captured = capsys.readouterr()
-    assert "Failed to load metrics" in captured.err
+    assert "Failed to compute metrics" in capsys.readouterr().err
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import os
 from zoneinfo import ZoneInfo
 
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 
 import pytest
 
 from google_ads_alert.config import (
+    _CONFIG_KEYS,
     ApplicationConfig,
     ConfigError,
     SlackConfig,
+    clear_config_cache,
     load_config,
     load_config_from_env_file,
     load_env_file,
@@ -21,8 +26,12 @@ from google_ads_alert.google_ads_client import GoogleAdsClientConfig
 from google_ads_alert.schedule import DailyScheduleConfig
 
 
-def _base_env() -> dict[str, str]:
-    return {
+UTC = ZoneInfo("UTC")
+
+
+# Read-only so no test can leak changes into the others.
+_BASE_ENV = MappingProxyType(
+    {
         "GOOGLE_ADS_DEVELOPER_TOKEN": "dev-token",
         "GOOGLE_ADS_CLIENT_ID": "client-id",
         "GOOGLE_ADS_CLIENT_SECRET": "client-secret",
@@ -30,10 +39,12 @@ def _base_env() -> dict[str, str]:
         "GOOGLE_ADS_CUSTOMER_ID": "123-456-7890",
         "SLACK_WEBHOOK_URL": "https://hooks.slack.test/T000/B000/XXX",
     }
+)
 
 
 def test_load_google_ads_config_success() -> None:
-    env = _base_env() | {
+    env = {
+        **_BASE_ENV,
         "GOOGLE_ADS_TIMEZONE": "UTC",
         "GOOGLE_ADS_LOGIN_CUSTOMER_ID": "987-654-3210",
         "GOOGLE_ADS_ENDPOINT": "https://example.googleapis.com",
@@ -45,12 +56,12 @@ def test_load_google_ads_config_success() -> None:
     assert config.customer_id == "123-456-7890"
     assert config.credentials.developer_token == "dev-token"
     assert config.credentials.login_customer_id == "987-654-3210"
-    assert config.timezone == ZoneInfo("UTC")
+    assert config.timezone == UTC
     assert config.endpoint == "https://example.googleapis.com"
 
 
 def test_load_google_ads_config_missing_required() -> None:
-    env = _base_env()
+    env = dict(_BASE_ENV)
     del env["GOOGLE_ADS_CUSTOMER_ID"]
 
     with pytest.raises(ConfigError):
@@ -58,7 +69,8 @@ def test_load_google_ads_config_missing_required() -> None:
 
 
 def test_load_slack_config_defaults_and_overrides() -> None:
-    env = _base_env() | {
+    env = {
+        **_BASE_ENV,
         "SLACK_ACCOUNT_NAME": "Marketing Team",
         "SLACK_CURRENCY_SYMBOL": "$",
         "SLACK_TIMEZONE": "UTC",
@@ -73,14 +85,15 @@ def test_load_slack_config_defaults_and_overrides() -> None:
     assert config.webhook_url.endswith("XXX")
     assert config.options.account_name == "Marketing Team"
     assert config.options.currency_symbol == "$"
-    assert config.options.timezone == ZoneInfo("UTC")
+    assert config.options.timezone == UTC
     assert config.options.include_monthly_section is False
     assert config.options.include_spend_rate is True
     assert config.options.include_average_daily_spend is True
 
 
 def test_load_schedule_config_with_overrides() -> None:
-    env = _base_env() | {
+    env = {
+        **_BASE_ENV,
         "ALERT_TIMEZONE": "UTC",
         "ALERT_START_HOUR": "9",
         "ALERT_START_MINUTE": "30",
@@ -92,7 +105,7 @@ def test_load_schedule_config_with_overrides() -> None:
     config = load_schedule_config(env)
 
     assert isinstance(config, DailyScheduleConfig)
-    assert config.timezone == ZoneInfo("UTC")
+    assert config.timezone == UTC
     assert config.start_hour == 9
     assert config.start_minute == 30
     assert config.end_hour == 21
@@ -101,7 +114,8 @@ def test_load_schedule_config_with_overrides() -> None:
 
 
 def test_load_config_aggregates_sections() -> None:
-    env = _base_env() | {
+    env = {
+        **_BASE_ENV,
         "GOOGLE_ADS_TIMEZONE": "UTC",
         "ALERT_TIMEZONE": "UTC",
         "ALERT_RUN_COUNT": "1",
@@ -114,7 +128,7 @@ def test_load_config_aggregates_sections() -> None:
     config = load_config(env)
 
     assert isinstance(config, ApplicationConfig)
-    assert config.google_ads.timezone == ZoneInfo("UTC")
+    assert config.google_ads.timezone == UTC
     assert config.slack.options.include_spend_rate is True
     assert config.slack.options.include_average_daily_spend is True
     assert config.schedule.run_count == 1
@@ -127,12 +141,41 @@ def test_load_config_aggregates_sections() -> None:
     ["SLACK_INCLUDE_SPEND_RATE", "SLACK_INCLUDE_AVERAGE_DAILY_SPEND"],
 )
 def test_load_slack_config_invalid_boolean_raises(key: str) -> None:
-    env = _base_env() | {key: "maybe"}
+    env = {**_BASE_ENV, key: "maybe"}
 
     with pytest.raises(ConfigError):
         load_slack_config(env)
 
 
+def test_load_config_memoizes_on_recognised_settings() -> None:
+    clear_config_cache()
+    env = {**_BASE_ENV, "DAILY_BUDGET": "1000"}
+
+    first = load_config(env)
+
+    assert load_config(dict(env)) is first
+    assert load_config(env | {"UNRELATED_SETTING": "x"}) is first
+    assert load_config(env | {"DAILY_BUDGET": "2000"}).daily_budget == 2000.0
+
+
+def test_config_keys_cover_every_setting_read() -> None:
+    class RecordingEnv(dict):
+        def __init__(self, values: Mapping[str, str]) -> None:
+            super().__init__(values)
+            self.seen: set[str] = set()
+
+        def get(self, key, default=None):
+            self.seen.add(key)
+            return super().get(key, default)
+
+    env = RecordingEnv(_BASE_ENV)
+    load_google_ads_config(env)
+    load_slack_config(env)
+    load_schedule_config(env)
+
+    assert env.seen <= set(_CONFIG_KEYS)
+
+
 def test_load_env_file_parses_values(tmp_path: Path) -> None:
     env_file = tmp_path / ".env"
     env_file.write_text(
@@ -168,7 +211,8 @@ def test_load_config_from_env_file_merges_with_base_env(tmp_path: Path) -> None:
         """.strip()
     )
 
-    base_env = _base_env() | {
+    base_env = {
+        **_BASE_ENV,
         "GOOGLE_ADS_CLIENT_SECRET": "base-secret",
         "GOOGLE_ADS_CLIENT_ID": "base-client",
     }
@@ -180,3 +224,59 @@ def test_load_config_from_env_file_merges_with_base_env(tmp_path: Path) -> None:
     assert config.google_ads.credentials.client_id == "base-client"
     assert config.schedule.run_count == 1
 
+
+def test_load_env_file_reparses_after_file_changes(tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("ALERT_RUN_COUNT=1\n")
+
+    first = load_env_file(env_file)
+    first["ALERT_RUN_COUNT"] = "mutated"
+
+    assert load_env_file(env_file) == {"ALERT_RUN_COUNT": "1"}
+
+    env_file.write_text("ALERT_RUN_COUNT=12\n")
+
+    assert load_env_file(env_file) == {"ALERT_RUN_COUNT": "12"}
+
+
+def test_load_env_file_reparses_same_size_replacement_with_same_mtime(tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("ALERT_RUN_COUNT=1\n")
+    original = env_file.stat()
+
+    assert load_env_file(env_file) == {"ALERT_RUN_COUNT": "1"}
+
+    # An atomic same-size rewrite whose mtime matches the original, as on a
+    # filesystem with coarse timestamps: only the inode tells the files apart.
+    replacement = tmp_path / ".env.new"
+    replacement.write_text("ALERT_RUN_COUNT=3\n")
+    os.utime(replacement, ns=(original.st_atime_ns, original.st_mtime_ns))
+    os.replace(replacement, env_file)
+
+    assert env_file.stat().st_size == original.st_size
+    assert env_file.stat().st_mtime_ns == original.st_mtime_ns
+    assert load_env_file(env_file) == {"ALERT_RUN_COUNT": "3"}
+
+
+def test_load_env_file_missing_file_raises(tmp_path: Path) -> None:
+    with pytest.raises(ConfigError):
+        load_env_file(tmp_path / "missing.env")
+
+
+@pytest.mark.parametrize(
+    "line",
+    ["NO_EQUALS_SIGN", "=missing-key", 'QUOTED="unterminated'],
+)
+def test_load_env_file_rejects_malformed_lines(tmp_path: Path, line: str) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text(f"ALERT_RUN_COUNT=1\n{line}\n")
+
+    with pytest.raises(ConfigError, match="line 2"):
+        load_env_file(env_file)
+
+
+def test_load_env_file_handles_crlf_line_endings(tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_bytes(b"ALERT_RUN_COUNT=3\r\n# comment\r\nSLACK_CHANNEL= #alerts\r\n")
+
+    assert load_env_file(env_file) == {"ALERT_RUN_COUNT": "3", "SLACK_CHANNEL": "#alerts"}
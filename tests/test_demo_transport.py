@@ -9,9 +9,14 @@ from google_ads_alert.google_ads_client import (
     GoogleAdsCostService,
     GoogleAdsCredentials,
 )
+from google_ads_alert.transports import demo
 from google_ads_alert.transports.demo import build_transport
 
 
+TOKYO = ZoneInfo("Asia/Tokyo")
+REFERENCE = datetime(2024, 6, 15, 12, 0, tzinfo=TOKYO)
+
+
 def _build_config() -> GoogleAdsClientConfig:
     return GoogleAdsClientConfig(
         customer_id="123-456-7890",
@@ -21,7 +26,7 @@ def _build_config() -> GoogleAdsClientConfig:
             client_secret="secret",
             refresh_token="refresh",
         ),
-        timezone=ZoneInfo("Asia/Tokyo"),
+        timezone=TOKYO,
     )
 
 
@@ -31,10 +36,20 @@ def test_demo_transport_uses_configured_costs() -> None:
 
     transport = build_transport(config, env)
     service = GoogleAdsCostService(config, transport)
-    reference = datetime(2024, 6, 15, 12, 0, tzinfo=ZoneInfo("Asia/Tokyo"))
 
-    daily = service.fetch_daily_cost(reference)
-    monthly = service.fetch_month_to_date_cost(reference)
+    daily = service.fetch_daily_cost(REFERENCE)
+    monthly = service.fetch_month_to_date_cost(REFERENCE)
+
+    assert daily.total_cost == pytest.approx(1234.5)
+    assert monthly.total_cost == pytest.approx(67890.0)
+
+
+def test_demo_transport_supports_single_query_fetch() -> None:
+    config = _build_config()
+    env = {"DEMO_DAILY_COST": "1234.5", "DEMO_MONTH_TO_DATE_COST": "67890.0"}
+    service = GoogleAdsCostService(config, build_transport(config, env))
+
+    daily, monthly = service.fetch_costs(REFERENCE)
 
     assert daily.total_cost == pytest.approx(1234.5)
     assert monthly.total_cost == pytest.approx(67890.0)
@@ -44,10 +59,9 @@ def test_demo_transport_defaults_apply_without_env() -> None:
     config = _build_config()
     transport = build_transport(config, {})
     service = GoogleAdsCostService(config, transport)
-    reference = datetime(2024, 6, 15, 12, 0, tzinfo=ZoneInfo("Asia/Tokyo"))
 
-    daily = service.fetch_daily_cost(reference)
-    monthly = service.fetch_month_to_date_cost(reference)
+    daily = service.fetch_daily_cost(REFERENCE)
+    monthly = service.fetch_month_to_date_cost(REFERENCE)
 
     assert daily.total_cost == pytest.approx(50_000.0)
     assert monthly.total_cost == pytest.approx(1_200_000.0)
@@ -70,3 +84,15 @@ def test_demo_transport_requires_between_clause() -> None:
 
     with pytest.raises(ConfigError):
         list(transport.search(config.customer_id, "SELECT metrics.cost_micros FROM campaign"))
+
+
+def test_demo_transport_parses_each_query_range_once() -> None:
+    config = _build_config()
+    service = GoogleAdsCostService(config, build_transport(config, {}))
+    demo._parse_query_dates.cache_clear()
+
+    for _ in range(3):
+        service.fetch_costs(REFERENCE)
+
+    info = demo._parse_query_dates.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
@@ -2,6 +2,7 @@ from datetime import datetime
 
 import pytest
 
+from google_ads_alert import forecast
 from google_ads_alert.forecast import (
     CombinedForecastInput,
     DailyForecastInput,
@@ -14,10 +15,11 @@ from zoneinfo import ZoneInfo
 
 
 TOKYO = ZoneInfo("Asia/Tokyo")
+MIDDAY_TOKYO = datetime(2024, 1, 15, 12, 0, tzinfo=TOKYO)
 
 
 def test_daily_projection_midday():
-    as_of = datetime(2024, 1, 15, 12, 0, tzinfo=TOKYO)
+    as_of = MIDDAY_TOKYO
     params = DailyForecastInput(
         as_of=as_of,
         current_spend=5000.0,
@@ -93,7 +95,7 @@ def test_monthly_pace_accepts_naive_datetime():
 
 
 def test_build_combined_forecast_returns_consistent_snapshot():
-    as_of = datetime(2024, 1, 15, 12, 0, tzinfo=TOKYO)
+    as_of = MIDDAY_TOKYO
     params = CombinedForecastInput(
         as_of=as_of,
         current_spend=5000.0,
@@ -124,3 +126,7 @@ def test_build_combined_forecast_handles_missing_budgets():
     assert result.daily_budget_gap is None
     assert result.monthly_budget_gap is None
 
+
+def test_default_timezone_is_resolved_once():
+    assert forecast.DEFAULT_TZ == TOKYO
+    assert forecast._coerce_timezone(None) is forecast.DEFAULT_TZ
@@ -12,6 +12,7 @@ from google_ads_alert.google_ads_client import (
     MonthToDateCostSummary,
     QueryRange,
     RetryConfig,
+    _extract_cost_micros,
     build_cost_query,
     build_daily_query_range,
     build_month_to_date_query_range,
@@ -20,9 +21,26 @@ from google_ads_alert.google_ads_client import (
 import pytest
 
 
+TOKYO = ZoneInfo("Asia/Tokyo")
+UTC = ZoneInfo("UTC")
+
+
+@pytest.fixture(scope="module")
+def ads_config() -> GoogleAdsClientConfig:
+    credentials = GoogleAdsCredentials(
+        developer_token="dev",
+        client_id="client",
+        client_secret="secret",
+        refresh_token="refresh",
+    )
+    return GoogleAdsClientConfig(customer_id="123-456-7890", credentials=credentials, timezone=TOKYO)
+
+
 class DummyTransport:
+    __slots__ = ("_rows", "requests")
+
     def __init__(self, rows: list[dict]) -> None:
-        self._rows = rows
+        self._rows = tuple(rows)
         self.requests: list[tuple[str, str]] = []
 
     def search(self, customer_id: str, query: str):  # pragma: no cover - simple passthrough
@@ -31,7 +49,7 @@ class DummyTransport:
 
 
 def test_build_daily_query_range_localizes_naive_datetime() -> None:
-    tz = ZoneInfo("Asia/Tokyo")
+    tz = TOKYO
     as_of = datetime(2024, 5, 15, 10, 30)  # naive
 
     query_range = build_daily_query_range(as_of, tz)
@@ -41,8 +59,8 @@ def test_build_daily_query_range_localizes_naive_datetime() -> None:
 
 
 def test_build_month_to_date_query_range_spans_first_day() -> None:
-    tz = ZoneInfo("Asia/Tokyo")
-    as_of = datetime(2024, 5, 15, 10, 30, tzinfo=ZoneInfo("UTC"))
+    tz = TOKYO
+    as_of = datetime(2024, 5, 15, 10, 30, tzinfo=UTC)
 
     query_range = build_month_to_date_query_range(as_of, tz)
 
@@ -51,7 +69,7 @@ def test_build_month_to_date_query_range_spans_first_day() -> None:
 
 
 def test_build_cost_query_spans_single_day() -> None:
-    tz = ZoneInfo("Asia/Tokyo")
+    tz = TOKYO
     query_range = QueryRange(
         start=datetime(2024, 4, 1, tzinfo=tz),
         end=datetime(2024, 4, 2, tzinfo=tz),
@@ -65,22 +83,15 @@ def test_build_cost_query_spans_single_day() -> None:
     assert "2024-04-01" == query.rsplit("'", 2)[1]
 
 
-def test_cost_service_aggregates_rows_and_converts_timezone() -> None:
-    tz = ZoneInfo("Asia/Tokyo")
-    credentials = GoogleAdsCredentials(
-        developer_token="dev",
-        client_id="client",
-        client_secret="secret",
-        refresh_token="refresh",
-    )
-    config = GoogleAdsClientConfig(customer_id="123-456-7890", credentials=credentials, timezone=tz)
+def test_cost_service_aggregates_rows_and_converts_timezone(ads_config: GoogleAdsClientConfig) -> None:
+    tz = TOKYO
     rows = [
         {"metrics": {"cost_micros": "1000000"}},
         {"metrics": {"cost_micros": 2000000}},
         {"metrics": {}},  # ignored
     ]
     transport = DummyTransport(rows)
-    service = GoogleAdsCostService(config, transport)
+    service = GoogleAdsCostService(ads_config, transport)
 
     summary = service.fetch_daily_cost(datetime(2024, 6, 10, 5, 0))
 
@@ -97,22 +108,15 @@ def test_cost_service_aggregates_rows_and_converts_timezone() -> None:
     assert "segments.date" in query
 
 
-def test_month_to_date_cost_service_aggregates_rows() -> None:
-    tz = ZoneInfo("Asia/Tokyo")
-    credentials = GoogleAdsCredentials(
-        developer_token="dev",
-        client_id="client",
-        client_secret="secret",
-        refresh_token="refresh",
-    )
-    config = GoogleAdsClientConfig(customer_id="123-456-7890", credentials=credentials, timezone=tz)
+def test_month_to_date_cost_service_aggregates_rows(ads_config: GoogleAdsClientConfig) -> None:
+    tz = TOKYO
     rows = [
         {"metrics": {"cost_micros": 2_000_000}},
         {"metrics": {"cost_micros": "3500000"}},
         {},
     ]
     transport = DummyTransport(rows)
-    service = GoogleAdsCostService(config, transport)
+    service = GoogleAdsCostService(ads_config, transport)
 
     summary = service.fetch_month_to_date_cost(datetime(2024, 6, 10, 5, 0))
 
@@ -129,9 +133,55 @@ def test_month_to_date_cost_service_aggregates_rows() -> None:
     assert "2024-06-10" in query
 
 
+def test_fetch_costs_splits_month_to_date_rows_in_one_request(ads_config: GoogleAdsClientConfig) -> None:
+    tz = TOKYO
+    rows = [
+        {"segments": {"date": "2024-06-01"}, "metrics": {"cost_micros": 4_000_000}},
+        {"segments": {"date": "2024-06-10"}, "metrics": {"cost_micros": "1500000"}},
+        {"segments": {"date": "2024-06-10"}, "metrics": {"cost_micros": 500_000}},
+    ]
+    transport = DummyTransport(rows)
+    service = GoogleAdsCostService(ads_config, transport)
+
+    daily, monthly = service.fetch_costs(datetime(2024, 6, 10, 5, 0))
+
+    assert len(transport.requests) == 1
+    assert daily.total_cost_micros == 2_000_000
+    assert daily.report_start == datetime(2024, 6, 10, tzinfo=tz)
+    assert daily.report_end == datetime(2024, 6, 11, tzinfo=tz)
+    assert monthly.total_cost_micros == 6_000_000
+    assert monthly.report_start == datetime(2024, 6, 1, tzinfo=tz)
+    assert daily.as_of == monthly.as_of
+
+
+def test_fetch_costs_queries_the_day_when_rows_lack_the_date_segment(
+    ads_config: GoogleAdsClientConfig,
+) -> None:
+    class RangeTransport:
+        def __init__(self) -> None:
+            self.queries: list[str] = []
+
+        def search(self, customer_id: str, query: str):
+            self.queries.append(query)
+            # Month-to-date rows come back unsegmented, like a plain metrics report.
+            cost = 9_000_000 if "2024-06-01" in query else 2_500_000
+            return iter([{"metrics": {"cost_micros": cost}}])
+
+    transport = RangeTransport()
+    service = GoogleAdsCostService(ads_config, transport)
+
+    daily, monthly = service.fetch_costs(datetime(2024, 6, 10, 5, 0))
+
+    assert len(transport.queries) == 2
+    assert daily.total_cost_micros == 2_500_000
+    assert monthly.total_cost_micros == 9_000_000
+
+
 class FlakyTransport:
+    __slots__ = ("_responses", "calls")
+
     def __init__(self, responses: list[list[dict] | Exception]) -> None:
-        self._responses = responses
+        self._responses = tuple(responses)
         self.calls: int = 0
 
     def search(self, customer_id: str, query: str):
@@ -142,23 +192,14 @@ class FlakyTransport:
         return iter(response)
 
 
-def test_cost_service_retries_and_eventually_succeeds() -> None:
-    tz = ZoneInfo("Asia/Tokyo")
-    credentials = GoogleAdsCredentials(
-        developer_token="dev",
-        client_id="client",
-        client_secret="secret",
-        refresh_token="refresh",
-    )
-    config = GoogleAdsClientConfig(customer_id="123", credentials=credentials, timezone=tz)
-
+def test_cost_service_retries_and_eventually_succeeds(ads_config: GoogleAdsClientConfig) -> None:
     transport = FlakyTransport(
         [RuntimeError("transient"), [{"metrics": {"cost_micros": "500000"}}]]
     )
     sleeps: list[float] = []
 
     service = GoogleAdsCostService(
-        config,
+        ads_config,
         transport,
         retry_config=RetryConfig(max_attempts=3, initial_backoff_seconds=0.25, backoff_multiplier=1),
         sleep=sleeps.append,
@@ -171,20 +212,12 @@ def test_cost_service_retries_and_eventually_succeeds() -> None:
     assert sleeps == [0.25]
 
 
-def test_cost_service_raises_after_retry_exhaustion() -> None:
-    tz = ZoneInfo("Asia/Tokyo")
-    credentials = GoogleAdsCredentials(
-        developer_token="dev",
-        client_id="client",
-        client_secret="secret",
-        refresh_token="refresh",
-    )
-    config = GoogleAdsClientConfig(customer_id="123", credentials=credentials, timezone=tz)
+def test_cost_service_raises_after_retry_exhaustion(ads_config: GoogleAdsClientConfig) -> None:
     transport = FlakyTransport([RuntimeError("err"), RuntimeError("err")])
     sleeps: list[float] = []
 
     service = GoogleAdsCostService(
-        config,
+        ads_config,
         transport,
         retry_config=RetryConfig(max_attempts=2, initial_backoff_seconds=0.1, backoff_multiplier=1),
         sleep=sleeps.append,
@@ -196,3 +229,27 @@ def test_cost_service_raises_after_retry_exhaustion() -> None:
     assert transport.calls == 2
     assert sleeps == [0.1]
 
+
+def test_retry_config_backoff_delays_grow_geometrically() -> None:
+    config = RetryConfig(max_attempts=4, initial_backoff_seconds=0.5, backoff_multiplier=2)
+
+    assert config.backoff_delays() == (0.5, 1.0, 2.0)
+    assert RetryConfig(max_attempts=1).backoff_delays() == ()
+
+
+@pytest.mark.parametrize(
+    ("row", "expected"),
+    [
+        ({"metrics": {"cost_micros": 1_500_000}}, 1_500_000),
+        ({"metrics": {"cost_micros": "2500000"}}, 2_500_000),
+        ({"metrics": {"cost_micros": 3.9}}, 3),
+        ({"metrics": {"cost_micros": "n/a"}}, 0),
+        ({"metrics": {"cost_micros": None}}, 0),
+        ({"metrics": {}}, 0),
+        ({"metrics": None}, 0),
+        ({}, 0),
+        ([], 0),
+    ],
+)
+def test_extract_cost_micros_handles_row_shapes(row, expected) -> None:
+    assert _extract_cost_micros(row) == expected
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def _run_python(code: str, **extra_env: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    env.pop("GOOGLE_ADS_ALERT_EAGER_IMPORT", None)
+    env.update(extra_env)
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def test_package_import_does_not_load_submodules() -> None:
+    result = _run_python(
+        "import sys, google_ads_alert\n"
+        "print(sorted(m for m in sys.modules if m.startswith('google_ads_alert.')))"
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_accessing_export_loads_only_its_submodule() -> None:
+    result = _run_python(
+        "import sys, google_ads_alert\n"
+        "google_ads_alert.DailyForecastInput\n"
+        "print('google_ads_alert.forecast' in sys.modules)\n"
+        "print('google_ads_alert.google_ads_client' in sys.modules)"
+    )
+
+    assert result.stdout.split() == ["True", "False"]
+
+
+def test_submodules_resolve_as_package_attributes() -> None:
+    result = _run_python(
+        "import sys, google_ads_alert\n"
+        "print(google_ads_alert.config.load_config_from_env_file.__module__)\n"
+        "print('google_ads_alert.metrics' in sys.modules)\n"
+        "print(google_ads_alert.schedule is sys.modules['google_ads_alert.schedule'])\n"
+        "print('metrics' in dir(google_ads_alert))"
+    )
+
+    assert result.stdout.split() == ["google_ads_alert.config", "False", "True", "True"]
+
+
+def test_eager_import_resolves_every_export() -> None:
+    result = _run_python(
+        "import google_ads_alert\n"
+        "missing = [n for n in google_ads_alert.__all__ if n not in vars(google_ads_alert)]\n"
+        "print(missing)",
+        GOOGLE_ADS_ALERT_EAGER_IMPORT="1",
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_cli_import_defers_http_client() -> None:
+    result = _run_python(
+        "import sys, google_ads_alert.cli\n"
+        "print('http.client' in sys.modules)"
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_forecast_import_defers_default_timezone() -> None:
+    result = _run_python(
+        "import google_ads_alert.forecast as forecast\n"
+        "print(forecast._get_default_tz.cache_info().currsize)"
+    )
+
+    assert result.stdout.strip() == "0"
@@ -5,6 +5,10 @@ from zoneinfo import ZoneInfo
 from google_ads_alert import LoggingConfig, configure_logging, get_logger
 
 
+TOKYO = ZoneInfo("Asia/Tokyo")
+UTC = ZoneInfo("UTC")
+
+
 class _BufferHandler(logging.Handler):
     def __init__(self) -> None:
         super().__init__()
@@ -15,7 +19,7 @@ class _BufferHandler(logging.Handler):
 
 
 def test_configure_logging_sets_timezone_for_formatter():
-    logger = configure_logging(LoggingConfig(timezone=ZoneInfo("Asia/Tokyo")))
+    logger = configure_logging(LoggingConfig(timezone=TOKYO))
 
     handler = logger.handlers[0]
     formatter = handler.formatter
@@ -44,6 +48,37 @@ def test_get_logger_returns_child_logger():
     child.addHandler(buffer)
     child.setLevel(logging.INFO)
     child.propagate = False
+    try:
+        child.info("message")
+    finally:
+        # Loggers are process-wide; leave the child as later tests expect it.
+        child.removeHandler(buffer)
+        child.setLevel(logging.NOTSET)
+        child.propagate = True
 
-    child.info("message")
     assert buffer.records
+
+
+def test_formatter_reuses_timestamp_within_same_second():
+    logger = configure_logging(LoggingConfig(timezone=UTC))
+    formatter = logger.handlers[0].formatter
+
+    def make_record(created: float) -> logging.LogRecord:
+        record = logging.LogRecord(logger.name, logging.INFO, __file__, 0, "msg", (), None)
+        record.created = created
+        return record
+
+    first = formatter.formatTime(make_record(1_700_000_000.1))
+
+    assert formatter.formatTime(make_record(1_700_000_000.9)) == first
+    assert formatter.formatTime(make_record(1_700_000_001.0)) == "2023-11-14 22:13:21 UTC"
+    assert formatter.formatTime(make_record(1_700_000_001.5), "%S.%f") == "21.500000"
+
+
+def test_configure_logging_keeps_handler_for_unchanged_config():
+    config = LoggingConfig(timezone=UTC)
+
+    handler = configure_logging(config).handlers[0]
+
+    assert configure_logging(LoggingConfig(timezone=UTC)).handlers == [handler]
+    assert configure_logging(LoggingConfig(timezone=TOKYO)).handlers != [handler]
@@ -14,6 +14,7 @@ from google_ads_alert.metrics import (
     compute_sli_report,
     filter_records_by_schedule,
     grouped_sli_reports_to_dict,
+    iter_alert_run_records_from_jsonl,
     load_alert_run_records_from_jsonl,
     render_grouped_sli_reports,
     render_sli_report,
@@ -21,9 +22,11 @@ from google_ads_alert.metrics import (
 )
 
 
+TOKYO = ZoneInfo("Asia/Tokyo")
+
+
 def _write_history(path: Path, rows: list[dict[str, object]]) -> None:
-    payload = "\n".join(json.dumps(row) for row in rows)
-    path.write_text(payload, encoding="utf-8")
+    path.write_bytes(b"\n".join(json.dumps(row).encode() for row in rows))
 
 
 def test_load_alert_run_records_from_jsonl(tmp_path: Path) -> None:
@@ -91,6 +94,11 @@ def test_compute_sli_report_returns_expected_ratios(tmp_path: Path) -> None:
     assert "Notification delivery" in summary
     assert "Data freshness" in summary
 
+    streamed = compute_sli_report(
+        iter_alert_run_records_from_jsonl(history), generated_at=report.generated_at
+    )
+    assert streamed == report
+
 
 def test_load_alert_run_records_reports_invalid_payload(tmp_path: Path) -> None:
     history = tmp_path / "history.jsonl"
@@ -100,6 +108,53 @@ def test_load_alert_run_records_reports_invalid_payload(tmp_path: Path) -> None:
         load_alert_run_records_from_jsonl(history)
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_alert_run_records_reports_malformed_json_line(
+    tmp_path: Path, monkeypatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr("google_ads_alert.metrics.orjson", None)
+    history = tmp_path / "history.jsonl"
+    history.write_bytes(
+        b'{"scheduled_for": "2024-05-01T08:00:00+09:00", "status": "success"}\n{not json\n'
+    )
+
+    with pytest.raises(MetricsLoadError, match="line 2"):
+        load_alert_run_records_from_jsonl(history)
+
+
+def test_load_alert_run_records_normalizes_status(tmp_path: Path) -> None:
+    history = tmp_path / "history.jsonl"
+    _write_history(
+        history,
+        [
+            {"scheduled_for": "2024-05-01T08:00:00+09:00", "status": " Skipped "},
+            {"scheduled_for": "2024-05-01T14:00:00+09:00", "status": "unknown"},
+        ],
+    )
+
+    with pytest.raises(MetricsLoadError, match="Unsupported status 'unknown'"):
+        load_alert_run_records_from_jsonl(history)
+
+    _write_history(history, [{"scheduled_for": "2024-05-01T08:00:00+09:00", "status": " Skipped "}])
+    (record,) = load_alert_run_records_from_jsonl(history)
+    assert record.status is AlertRunStatus.SKIPPED
+
+
+def test_iter_alert_run_records_yields_records_before_bad_line(tmp_path: Path) -> None:
+    history = tmp_path / "history.jsonl"
+    history.write_bytes(
+        b'{"scheduled_for": "2024-05-01T08:00:00+09:00", "status": "success"}\n\n{not json\n'
+    )
+
+    records = iter_alert_run_records_from_jsonl(history)
+    first = next(records)
+
+    assert first.status is AlertRunStatus.SUCCESS
+    with pytest.raises(MetricsLoadError, match="line 3"):
+        next(records)
+
+
 def test_filter_records_by_schedule_limits_range(tmp_path: Path) -> None:
     history = tmp_path / "history.jsonl"
     _write_history(
@@ -132,6 +187,39 @@ def test_filter_records_by_schedule_limits_range(tmp_path: Path) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("start", "end"),
+    [
+        ("2024-05-01T12:00:00+09:00", "2024-05-02T00:00:00+09:00"),
+        ("2024-05-01T14:00:00+09:00", None),
+        (None, "2024-05-01T14:00:00+09:00"),
+        (None, None),
+    ],
+)
+def test_filter_records_by_schedule_sorted_matches_scan(
+    tmp_path: Path, start: str | None, end: str | None
+) -> None:
+    history = tmp_path / "history.jsonl"
+    _write_history(
+        history,
+        [
+            {"scheduled_for": "2024-05-01T08:00:00+09:00", "status": "success"},
+            {"scheduled_for": "2024-05-01T14:00:00+09:00", "status": "failure"},
+            {"scheduled_for": "2024-05-01T14:00:00+09:00", "status": "success"},
+            {"scheduled_for": "2024-05-02T08:00:00+09:00", "status": "success"},
+        ],
+    )
+    records = load_alert_run_records_from_jsonl(history)
+    bounds = {
+        "start": datetime.fromisoformat(start) if start else None,
+        "end": datetime.fromisoformat(end) if end else None,
+    }
+
+    assert filter_records_by_schedule(
+        records, assume_sorted=True, **bounds
+    ) == filter_records_by_schedule(records, **bounds)
+
+
 def test_filter_records_by_schedule_rejects_invalid_range(tmp_path: Path) -> None:
     history = tmp_path / "history.jsonl"
     _write_history(
@@ -215,7 +303,7 @@ def test_compute_grouped_sli_reports_groups_by_day(tmp_path: Path) -> None:
     grouped = compute_grouped_sli_reports(
         records,
         group_by="day",
-        grouping_timezone=ZoneInfo("Asia/Tokyo"),
+        grouping_timezone=TOKYO,
         generated_at=datetime(2024, 5, 3, tzinfo=timezone.utc),
     )
 
@@ -224,6 +312,23 @@ def test_compute_grouped_sli_reports_groups_by_day(tmp_path: Path) -> None:
     assert grouped[1].report.notification_delivery.numerator == 1
 
 
+def test_compute_grouped_sli_reports_share_identical_measurements(tmp_path: Path) -> None:
+    history = tmp_path / "history.jsonl"
+    _write_history(
+        history,
+        [
+            {"scheduled_for": "2024-05-01T08:00:00+00:00", "status": "success"},
+            {"scheduled_for": "2024-05-02T08:00:00+00:00", "status": "success"},
+        ],
+    )
+
+    records = load_alert_run_records_from_jsonl(history)
+    first, second = compute_grouped_sli_reports(records, group_by="day")
+
+    assert first.report.notification_delivery is second.report.notification_delivery
+    assert first.report.notification_delivery.value == 1.0
+
+
 def test_compute_grouped_sli_reports_groups_by_week(tmp_path: Path) -> None:
     history = tmp_path / "history.jsonl"
     _write_history(
@@ -254,7 +359,7 @@ def test_compute_grouped_sli_reports_groups_by_week(tmp_path: Path) -> None:
     grouped = compute_grouped_sli_reports(
         records,
         group_by="week",
-        grouping_timezone=ZoneInfo("Asia/Tokyo"),
+        grouping_timezone=TOKYO,
         generated_at=datetime(2024, 5, 9, tzinfo=timezone.utc),
     )
 
@@ -287,7 +392,7 @@ def test_compute_grouped_sli_reports_groups_by_month(tmp_path: Path) -> None:
     grouped = compute_grouped_sli_reports(
         records,
         group_by="month",
-        grouping_timezone=ZoneInfo("Asia/Tokyo"),
+        grouping_timezone=TOKYO,
         generated_at=datetime(2024, 5, 20, tzinfo=timezone.utc),
     )
 
@@ -313,7 +418,7 @@ def test_render_grouped_sli_reports_returns_text_for_day_grouping(tmp_path: Path
     grouped = compute_grouped_sli_reports(
         records,
         group_by="day",
-        grouping_timezone=ZoneInfo("Asia/Tokyo"),
+        grouping_timezone=TOKYO,
     )
 
     text = render_grouped_sli_reports(
@@ -342,7 +447,7 @@ def test_render_grouped_sli_reports_returns_text_for_week_grouping(tmp_path: Pat
     grouped = compute_grouped_sli_reports(
         records,
         group_by="week",
-        grouping_timezone=ZoneInfo("Asia/Tokyo"),
+        grouping_timezone=TOKYO,
     )
 
     text = render_grouped_sli_reports(
@@ -371,7 +476,7 @@ def test_render_grouped_sli_reports_returns_text_for_month_grouping(tmp_path: Pa
     grouped = compute_grouped_sli_reports(
         records,
         group_by="month",
-        grouping_timezone=ZoneInfo("Asia/Tokyo"),
+        grouping_timezone=TOKYO,
     )
 
     text = render_grouped_sli_reports(
@@ -401,7 +506,7 @@ def test_grouped_sli_reports_to_dict_serialises_groups(tmp_path: Path) -> None:
     grouped = compute_grouped_sli_reports(
         records,
         group_by="day",
-        grouping_timezone=ZoneInfo("Asia/Tokyo"),
+        grouping_timezone=TOKYO,
     )
 
     payload = grouped_sli_reports_to_dict(
@@ -431,7 +536,7 @@ def test_grouped_sli_reports_to_dict_serialises_week_groups(tmp_path: Path) -> N
     grouped = compute_grouped_sli_reports(
         records,
         group_by="week",
-        grouping_timezone=ZoneInfo("Asia/Tokyo"),
+        grouping_timezone=TOKYO,
     )
 
     payload = grouped_sli_reports_to_dict(
@@ -461,7 +566,7 @@ def test_grouped_sli_reports_to_dict_serialises_month_groups(tmp_path: Path) ->
     grouped = compute_grouped_sli_reports(
         records,
         group_by="month",
-        grouping_timezone=ZoneInfo("Asia/Tokyo"),
+        grouping_timezone=TOKYO,
     )
 
     payload = grouped_sli_reports_to_dict(
@@ -8,12 +8,16 @@ from google_ads_alert.schedule import (
     DailyScheduleWindow,
     find_next_run_datetime,
     generate_daily_schedule,
+    generate_daily_schedule_slots,
     generate_upcoming_run_times,
     generate_upcoming_run_windows,
+    iter_upcoming_run_times,
+    prepare_schedule,
 )
 
 
 TOKYO = ZoneInfo("Asia/Tokyo")
+UTC = ZoneInfo("UTC")
 
 
 def test_generate_schedule_default_config_produces_three_runs():
@@ -30,6 +34,15 @@ def test_generate_schedule_default_config_produces_three_runs():
         assert pytest.approx(delta, rel=1e-6) == 6
 
 
+def test_generate_schedule_returns_independent_lists_for_cached_days():
+    first = generate_daily_schedule(date(2024, 1, 5))
+    first.clear()
+
+    second = generate_daily_schedule(date(2024, 1, 5))
+
+    assert [run.hour for run in second] == [8, 14, 20]
+
+
 def test_generate_schedule_respects_custom_timezone():
     london = ZoneInfo("Europe/London")
     schedule = generate_daily_schedule(
@@ -41,6 +54,13 @@ def test_generate_schedule_respects_custom_timezone():
     assert schedule[-1].hour == 20
 
 
+def test_generate_schedule_accepts_timezone_name():
+    by_name = generate_daily_schedule(date(2024, 1, 5), DailyScheduleConfig(timezone="Asia/Tokyo"))
+
+    assert by_name == generate_daily_schedule(date(2024, 1, 5), DailyScheduleConfig(timezone=TOKYO))
+    assert all(run.tzinfo is TOKYO for run in by_name)
+
+
 def test_generate_schedule_with_single_run_returns_start_only():
     schedule = generate_daily_schedule(
         date(2024, 1, 5), DailyScheduleConfig(run_count=1, start_hour=10)
@@ -74,6 +94,20 @@ def test_generate_schedule_supports_minute_precision():
         assert pytest.approx(delta, rel=1e-9) == expected_step
 
 
+@pytest.mark.parametrize("run_count", [3, 7, 8, 13])
+def test_generate_schedule_uses_exact_offsets_for_uneven_steps(run_count: int):
+    schedule = generate_daily_schedule(
+        date(2024, 1, 5),
+        DailyScheduleConfig(start_hour=8, end_hour=20, end_minute=7, run_count=run_count),
+    )
+
+    interval = timedelta(hours=12, minutes=7)
+    assert schedule[-1] == datetime(2024, 1, 5, 20, 7, tzinfo=TOKYO)
+    assert [run - schedule[0] for run in schedule] == [
+        interval * i / (run_count - 1) for i in range(run_count)
+    ]
+
+
 def test_generate_schedule_invalid_hours_raise_error():
     with pytest.raises(ValueError):
         generate_daily_schedule(date(2024, 1, 5), DailyScheduleConfig(start_hour=-1))
@@ -120,7 +154,7 @@ def test_find_next_run_datetime_uses_reference_timezone_for_naive_schedule():
     schedule = [
         entry.replace(tzinfo=None) for entry in generate_daily_schedule(date(2024, 1, 5))
     ]
-    now = datetime(2024, 1, 5, 7, 0, tzinfo=ZoneInfo("UTC"))
+    now = datetime(2024, 1, 5, 7, 0, tzinfo=UTC)
 
     next_run = find_next_run_datetime(now, schedule)
 
@@ -132,7 +166,7 @@ def test_find_next_run_datetime_uses_reference_timezone_for_naive_schedule():
 
 def test_find_next_run_datetime_handles_timezone_conversion():
     schedule = generate_daily_schedule(date(2024, 1, 5))
-    now_utc = datetime(2024, 1, 5, 9, 0, tzinfo=ZoneInfo("UTC"))
+    now_utc = datetime(2024, 1, 5, 9, 0, tzinfo=UTC)
 
     next_run = find_next_run_datetime(now_utc, schedule)
 
@@ -147,6 +181,29 @@ def test_find_next_run_datetime_returns_none_when_all_past():
     assert find_next_run_datetime(after_last, schedule) is None
 
 
+def test_find_next_run_datetime_sorted_schedule_matches_unsorted_search():
+    schedule = generate_upcoming_run_times(datetime(2024, 1, 5, 0, 0, tzinfo=TOKYO), days=3)
+    shuffled = list(reversed(schedule))
+
+    for offset in range(-60, 3 * 24 * 60, 170):
+        now = datetime(2024, 1, 5, 0, 0, tzinfo=UTC) + timedelta(minutes=offset)
+        assert find_next_run_datetime(
+            now, schedule, assume_sorted=True
+        ) == find_next_run_datetime(now, shuffled)
+
+
+def test_prepare_schedule_normalizes_sorts_and_supports_polling():
+    schedule = generate_upcoming_run_times(datetime(2024, 1, 5, 0, 0, tzinfo=TOKYO), days=2)
+    mixed = [*reversed(schedule[1:]), schedule[0].astimezone(UTC)]
+
+    prepared = prepare_schedule(mixed)
+
+    assert prepared == tuple(schedule)
+    assert all(run.tzinfo is TOKYO for run in prepared)
+    now = schedule[2] - timedelta(minutes=1)
+    assert find_next_run_datetime(now, prepared, assume_sorted=True) is prepared[2]
+
+
 def test_generate_upcoming_run_times_filters_past_entries_and_future_days():
     now = datetime(2024, 1, 5, 10, 0, tzinfo=TOKYO)
 
@@ -158,6 +215,20 @@ def test_generate_upcoming_run_times_filters_past_entries_and_future_days():
     assert upcoming[-1].date() == date(2024, 1, 6)
 
 
+def test_iter_upcoming_run_times_builds_later_days_on_demand():
+    from google_ads_alert import schedule
+
+    now = datetime(2024, 1, 5, 10, 0, tzinfo=TOKYO)
+    schedule._daily_schedule_cached.cache_clear()
+
+    runs = iter_upcoming_run_times(now, days=30)
+    first = next(runs)
+
+    assert first == datetime(2024, 1, 5, 14, 0, tzinfo=TOKYO)
+    assert schedule._daily_schedule_cached.cache_info().currsize == 1
+    assert [first, *runs] == generate_upcoming_run_times(now, days=30)
+
+
 def test_generate_upcoming_run_times_localizes_naive_reference():
     london = ZoneInfo("Europe/London")
     config = DailyScheduleConfig(timezone=london, start_hour=9, end_hour=18, run_count=3)
@@ -196,6 +267,32 @@ def test_generate_upcoming_run_times_interprets_fixed_offset_timezone_reference(
     assert all(run.date() == now.date() for run in upcoming)
 
 
+def test_fixed_offset_reference_without_zone_name_falls_back_to_default_zone():
+    now = datetime(2024, 6, 1, 8, 30, tzinfo=timezone(timedelta(hours=9)))
+
+    first = generate_upcoming_run_times(now, days=1)
+    second = generate_upcoming_run_times(now, days=1)
+
+    assert first == second
+    assert all(run.tzinfo is TOKYO for run in first)
+
+
+def test_generate_upcoming_run_times_keeps_wall_clock_across_dst_change():
+    new_york = ZoneInfo("America/New_York")
+    now = datetime(2024, 3, 9, 0, 0, tzinfo=new_york)
+
+    upcoming = generate_upcoming_run_times(
+        now, days=3, config=DailyScheduleConfig(timezone=new_york)
+    )
+
+    assert [(run.day, run.hour) for run in upcoming] == [
+        (day, hour) for day in (9, 10, 11) for hour in (8, 14, 20)
+    ]
+    # 2024-03-10 is the spring-forward day, so consecutive 08:00 runs are 23h apart.
+    elapsed = upcoming[3].astimezone(timezone.utc) - upcoming[0].astimezone(timezone.utc)
+    assert elapsed == timedelta(hours=23)
+
+
 def test_generate_upcoming_run_times_rejects_non_positive_days():
     now = datetime(2024, 1, 5, 8, 0, tzinfo=TOKYO)
 
@@ -225,3 +322,14 @@ def test_generate_upcoming_run_windows_localizes_naive_reference():
     assert windows[0].date == date(2024, 6, 1)
     assert windows[0].run_times[0] >= now.replace(tzinfo=london)
     assert all(run.tzinfo == london for run in windows[0].run_times)
+
+
+def test_generate_daily_schedule_slots_deduplicates_and_converts_timezone():
+    config = DailyScheduleConfig(
+        timezone=TOKYO, start_hour=8, end_hour=8, run_count=3
+    )
+
+    assert generate_daily_schedule_slots(date(2024, 1, 5), config) == [(8, 0, 0)]
+    assert generate_daily_schedule_slots(
+        date(2024, 1, 5), config, UTC
+    ) == [(23, 0, 0)]
@@ -13,6 +13,10 @@ from google_ads_alert.workflow import (
 )
 
 
+TOKYO = ZoneInfo("Asia/Tokyo")
+UTC = ZoneInfo("UTC")
+
+
 class DummyCostService:
     def __init__(
         self,
@@ -33,29 +37,31 @@ class DummyCostService:
         return self._monthly
 
 
+# The summaries are frozen, so they are built once; only the recording service
+# is fresh per test.
+_DAILY_SUMMARY = DailyCostSummary(
+    as_of=datetime(2024, 6, 10, 12, 0, tzinfo=TOKYO),
+    report_start=datetime(2024, 6, 10, tzinfo=TOKYO),
+    report_end=datetime(2024, 6, 11, tzinfo=TOKYO),
+    total_cost_micros=5_000_000,
+)
+_MONTHLY_SUMMARY = MonthToDateCostSummary(
+    as_of=datetime(2024, 6, 10, 12, 0, tzinfo=TOKYO),
+    report_start=datetime(2024, 6, 1, tzinfo=TOKYO),
+    report_end=datetime(2024, 6, 11, tzinfo=TOKYO),
+    total_cost_micros=55_000_000,
+)
+_REFERENCE = datetime(2024, 6, 10, 3, 0, tzinfo=UTC)
+
+
 @pytest.fixture
 def snapshot_inputs() -> tuple[DummyCostService, datetime]:
-    tz = ZoneInfo("Asia/Tokyo")
-    daily_summary = DailyCostSummary(
-        as_of=datetime(2024, 6, 10, 12, 0, tzinfo=tz),
-        report_start=datetime(2024, 6, 10, tzinfo=tz),
-        report_end=datetime(2024, 6, 11, tzinfo=tz),
-        total_cost_micros=5_000_000,
-    )
-    monthly_summary = MonthToDateCostSummary(
-        as_of=datetime(2024, 6, 10, 12, 0, tzinfo=tz),
-        report_start=datetime(2024, 6, 1, tzinfo=tz),
-        report_end=datetime(2024, 6, 11, tzinfo=tz),
-        total_cost_micros=55_000_000,
-    )
-    service = DummyCostService(daily_summary, monthly_summary)
-    reference = datetime(2024, 6, 10, 3, 0, tzinfo=ZoneInfo("UTC"))
-    return service, reference
+    return DummyCostService(_DAILY_SUMMARY, _MONTHLY_SUMMARY), _REFERENCE
 
 
 def test_build_forecast_snapshot_aggregates_costs(snapshot_inputs) -> None:
     service, reference = snapshot_inputs
-    tz = ZoneInfo("Asia/Tokyo")
+    tz = TOKYO
 
     snapshot = build_forecast_snapshot(
         service,
@@ -76,6 +82,16 @@ def test_build_forecast_snapshot_aggregates_costs(snapshot_inputs) -> None:
     assert snapshot.forecast.monthly.month_to_date_spend == pytest.approx(55.0)
 
 
+def test_build_forecast_snapshot_reuses_summary_timezone(snapshot_inputs) -> None:
+    service, reference = snapshot_inputs
+
+    snapshot = build_forecast_snapshot(service, as_of=reference)
+
+    # The summary already carries a ZoneInfo, so it is used as-is rather than
+    # re-resolved, and the forecast does not need to convert ``as_of``.
+    assert snapshot.forecast.daily.as_of is service._daily.as_of
+
+
 def test_dispatch_slack_alert_sends_payload(snapshot_inputs) -> None:
     service, reference = snapshot_inputs
 